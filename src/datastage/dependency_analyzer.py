@@ -4,6 +4,7 @@ import re
 from typing import Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 from collections import defaultdict
+from itertools import islice
 from datetime import datetime
 
 from src.core.logger import get_logger
@@ -547,7 +548,7 @@ class DependencyAnalyzer:
             try:
                 # 파일이 DSX 형식인지 확인
                 with open(dsx_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    first_lines = ''.join(f.readlines()[:5])
+                    first_lines = ''.join(islice(f, 5))  # 앞 5줄만 읽음 (파일 전체를 읽지 않음)
                     if 'BEGIN HEADER' not in first_lines and 'BEGIN DSJOB' not in first_lines:
                         continue
                 
@@ -681,7 +682,7 @@ class DependencyAnalyzer:
             try:
                 # 파일이 DSX 형식인지 확인
                 with open(dsx_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    first_lines = ''.join(f.readlines()[:5])
+                    first_lines = ''.join(islice(f, 5))  # 앞 5줄만 읽음 (파일 전체를 읽지 않음)
                     if 'BEGIN HEADER' not in first_lines and 'BEGIN DSJOB' not in first_lines:
                         continue
                 
@@ -851,7 +852,7 @@ class DependencyAnalyzer:
             try:
                 # 파일이 DSX 형식인지 확인
                 with open(dsx_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    first_lines = ''.join(f.readlines()[:5])
+                    first_lines = ''.join(islice(f, 5))  # 앞 5줄만 읽음 (파일 전체를 읽지 않음)
                     if 'BEGIN HEADER' not in first_lines and 'BEGIN DSJOB' not in first_lines:
                         continue
                 
@@ -1064,88 +1065,8 @@ class DependencyAnalyzer:
         
         for dsx_file in dsx_files:
             try:
-                # 파일이 DSX 형식인지 확인
-                with open(dsx_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    first_lines = ''.join(f.readlines()[:5])
-                    if 'BEGIN HEADER' not in first_lines and 'BEGIN DSJOB' not in first_lines:
-                        continue
-                
-                # 여러 Job이 포함된 경우 처리
-                with open(dsx_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                # 여러 Job 파싱
-                from src.datastage.dsx_parser import DSXParser
-                parser = DSXParser()
-                parsed_jobs = parser.parse_multiple_jobs(content, str(dsx_file))
-                
-                if parsed_jobs and len(parsed_jobs) > 1:
-                    # 여러 Job이 포함된 경우 - 각 Job별로 의존성 분석
-                    # DSJOB 섹션별로 내용 분리
-                    import re
-                    dsjob_pattern = r'BEGIN DSJOB\s+(.*?)\s+END DSJOB'
-                    dsjob_matches = list(re.finditer(dsjob_pattern, content, re.DOTALL))
-                    
-                    for i, job_info in enumerate(parsed_jobs):
-                        job_name = job_info.get("name")
-                        if not job_name:
-                            continue
-                        
-                        # 해당 Job의 내용 추출 (컬럼 정보 추출을 위해 필요)
-                        if i < len(dsjob_matches):
-                            dsjob_start = dsjob_matches[i].start()
-                            if i + 1 < len(dsjob_matches):
-                                next_dsjob_start = dsjob_matches[i + 1].start()
-                                job_content = content[dsjob_start:next_dsjob_start]
-                            else:
-                                job_content = content[dsjob_start:]
-                        else:
-                            job_content = content
-                        
-                        # parse_multiple_jobs에서 이미 추출한 테이블 정보 사용
-                        source_tables = job_info.get("source_tables", [])
-                        target_tables = job_info.get("target_tables", [])
-                        
-                        # 모든 테이블 (스키마 포함)
-                        all_tables = []
-                        for table in source_tables + target_tables:
-                            schema = table.get("schema", "")
-                            table_name = table.get("table_name", "")
-                            if table_name:
-                                full_name = f"{schema}.{table_name}" if schema else table_name
-                                all_tables.append({
-                                    "full_name": full_name,
-                                    "schema": schema,
-                                    "table_name": table_name,
-                                    "type": table.get("table_type", "unknown"),
-                                    "stage_name": table.get("stage_name", ""),
-                                    "stage_type": table.get("stage_type", "")
-                                })
-                        
-                        # 파라미터 해석 (옵션)
-                        if self.resolve_parameters and self.parameter_mapper:
-                            all_tables = self.parameter_mapper.map_tables(all_tables)
-                        
-                        # 컬럼 정보 추출 (job_content에서)
-                        columns = self._extract_columns(job_content)
-                        
-                        deps = {
-                            "job_name": job_name,
-                            "file_path": str(dsx_file),
-                            "tables": all_tables,
-                            "columns": columns,
-                            "source_tables": source_tables,
-                            "target_tables": target_tables
-                        }
-                        
-                        if deps and deps.get("job_name"):
-                            all_dependencies["jobs"].append(deps)
-                else:
-                    # 단일 Job으로 분석
-                    deps = self.analyze_job_dependencies(str(dsx_file))
-                    if deps:
-                        all_dependencies["jobs"].append(deps)
-                    
+                deps = self._analyze_dsx_file(dsx_file, all_dependencies["jobs"])
+                if deps:
                     # 테이블별 Job 매핑
                     for table in deps.get("tables", []):
                         full_name = table.get("full_name", "")
@@ -1173,6 +1094,119 @@ class DependencyAnalyzer:
         logger.info(f"전체 의존성 분석 완료: {len(all_dependencies['jobs'])}개 Job")
         return all_dependencies
     
+    def analyze_file_dependencies(self, dsx_file_path: str) -> List[Dict[str, Any]]:
+        """
+        단일 DSX 파일에 포함된 Job들의 의존성 분석
+        (analyze_all_dependencies의 "jobs" 항목을 파일 하나에 대해서만 생성)
+        
+        Args:
+            dsx_file_path: DSX 파일 경로
+        
+        Returns:
+            Job 의존성 정보 리스트
+        """
+        jobs: List[Dict[str, Any]] = []
+        try:
+            self._analyze_dsx_file(Path(dsx_file_path), jobs)
+        except Exception as e:
+            logger.debug(f"Job 분석 실패: {dsx_file_path} - {e}")
+        return jobs
+    
+    def _analyze_dsx_file(self, dsx_file: Path, jobs: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        DSX 파일 하나를 분석하여 Job 의존성 정보를 jobs에 추가
+        
+        Args:
+            dsx_file: DSX 파일 경로
+            jobs: 분석 결과를 추가할 리스트
+        
+        Returns:
+            단일 Job 파일이면 해당 Job 의존성 정보, 그 외에는 None
+        """
+        # 파일이 DSX 형식인지 확인
+        with open(dsx_file, 'r', encoding='utf-8', errors='ignore') as f:
+            first_lines = ''.join(islice(f, 5))  # 앞 5줄만 읽음 (파일 전체를 읽지 않음)
+            if 'BEGIN HEADER' not in first_lines and 'BEGIN DSJOB' not in first_lines:
+                return None
+        
+        # 여러 Job이 포함된 경우 처리
+        with open(dsx_file, 'r', encoding='utf-8', errors='ignore') as f:
+            content = f.read()
+        
+        # 여러 Job 파싱
+        from src.datastage.dsx_parser import DSXParser
+        parser = DSXParser()
+        parsed_jobs = parser.parse_multiple_jobs(content, str(dsx_file))
+        
+        if parsed_jobs and len(parsed_jobs) > 1:
+            # 여러 Job이 포함된 경우 - 각 Job별로 의존성 분석
+            # DSJOB 섹션별로 내용 분리
+            import re
+            dsjob_pattern = r'BEGIN DSJOB\s+(.*?)\s+END DSJOB'
+            dsjob_matches = list(re.finditer(dsjob_pattern, content, re.DOTALL))
+            
+            for i, job_info in enumerate(parsed_jobs):
+                job_name = job_info.get("name")
+                if not job_name:
+                    continue
+                
+                # 해당 Job의 내용 추출 (컬럼 정보 추출을 위해 필요)
+                if i < len(dsjob_matches):
+                    dsjob_start = dsjob_matches[i].start()
+                    if i + 1 < len(dsjob_matches):
+                        next_dsjob_start = dsjob_matches[i + 1].start()
+                        job_content = content[dsjob_start:next_dsjob_start]
+                    else:
+                        job_content = content[dsjob_start:]
+                else:
+                    job_content = content
+                
+                # parse_multiple_jobs에서 이미 추출한 테이블 정보 사용
+                source_tables = job_info.get("source_tables", [])
+                target_tables = job_info.get("target_tables", [])
+                
+                # 모든 테이블 (스키마 포함)
+                all_tables = []
+                for table in source_tables + target_tables:
+                    schema = table.get("schema", "")
+                    table_name = table.get("table_name", "")
+                    if table_name:
+                        full_name = f"{schema}.{table_name}" if schema else table_name
+                        all_tables.append({
+                            "full_name": full_name,
+                            "schema": schema,
+                            "table_name": table_name,
+                            "type": table.get("table_type", "unknown"),
+                            "stage_name": table.get("stage_name", ""),
+                            "stage_type": table.get("stage_type", "")
+                        })
+                
+                # 파라미터 해석 (옵션)
+                if self.resolve_parameters and self.parameter_mapper:
+                    all_tables = self.parameter_mapper.map_tables(all_tables)
+                
+                # 컬럼 정보 추출 (job_content에서)
+                columns = self._extract_columns(job_content)
+                
+                deps = {
+                    "job_name": job_name,
+                    "file_path": str(dsx_file),
+                    "tables": all_tables,
+                    "columns": columns,
+                    "source_tables": source_tables,
+                    "target_tables": target_tables
+                }
+                
+                if deps and deps.get("job_name"):
+                    jobs.append(deps)
+        else:
+            # 단일 Job으로 분석
+            deps = self.analyze_job_dependencies(str(dsx_file))
+            if deps:
+                jobs.append(deps)
+            return deps
+        return None
+    
     def build_cache_index(self, export_directory: Optional[str] = None, force_rebuild: bool = False) -> Dict[str, Any]:
         """
         캐시 인덱스 구축
@@ -1,13 +1,572 @@
 """DataStage Export 파일(.dsx) 파서 모듈"""
 
+import copy
+import fnmatch
+import functools
+import logging
+import mmap
+import os
 import re
-from typing import Dict, Any, List, Optional
+import sys
+import traceback
+import xml.etree.ElementTree as ET
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Dict, Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 from pathlib import Path
 
 from src.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 디렉토리 스캔 시 파일 읽기 스레드 수 (디코딩은 GIL을 잡으므로 I/O 대기만 겹칠 정도로 소수만 사용)
+_SCAN_READ_THREADS = 2
+# 디렉토리 스캔 시 미리 읽어 두는 최대 파일 수 (디코딩된 내용을 메모리에 들고 있으므로 작게 유지)
+_SCAN_READ_AHEAD = 3
+# scan_directory 파일별 결과 캐시 ((경로, 수정 시각, 크기) -> Job 요약 목록, 오래된 항목부터 제거)
+_SCAN_CACHE_SIZE = 256
+_scan_cache: "OrderedDict[Tuple[str, int, int], List[Dict[str, Any]]]" = OrderedDict()
+
+_ROOT_ANCHOR = 'Identifier "ROOT"'
+# SQL FROM 절의 테이블 참조 (문자 클래스에 공백이 없으므로 DOTALL 불필요)
+# [^\s,;]+ 가 '.'까지 포함하므로 스키마.테이블도 한 번에 잡힘 (중첩 반복 없이 역추적 불가)
+_RE_FROM_CLAUSE = re.compile(r'FROM\s+([^\s,;]+)', re.IGNORECASE)
+_RE_TABLEDEF = re.compile(r'TableDef\s+"([^"]+)"')
+# ERP/BIDW 포함 여부 (대소문자 무시, .upper() 사본 없이 검사)
+_RE_ERP = re.compile(r'ERP', re.IGNORECASE)
+_RE_BIDW = re.compile(r'BIDW', re.IGNORECASE)
+_DSRECORD_BEGIN = "BEGIN DSRECORD"
+_DSRECORD_END = "END DSRECORD"
+_DSRECORD_HEAD_RE = re.compile(r'\s+Identifier\s+"([^"]+)"')
+_RE_CONTEXT_TAG = re.compile(r'<Context[^>]*>(\d+)</Context>')
+_DSSUBRECORD_END = "END DSSUBRECORD"
+# 소스/타겟 Stage 이름(소문자)에 포함되는 키워드
+_RE_SOURCE_KW = re.compile(r'source|input|read|from|_s_|_src')
+_RE_SOURCE_KW_BASIC = re.compile(r'source|input|read|from')  # _extract_all_tables용 (_s_, _src 제외)
+_RE_TARGET_KW = re.compile(r'target|output|write|to|_t_|_tgt')
+# _extract_all_tables의 소스/타겟 키워드를 한 번에 찾는 패턴 (그룹 1 = 소스, 그룹 2 = 타겟)
+_RE_STAGE_KW_BASIC = re.compile(r'(source|input|read|from)|(target|output|write|to|_t_|_tgt)')
+# 소스/타겟 Stage 이름(소문자) 접두사: s_, l_s_, s2_, l_s4_ / t_, l_t_, t1_, l_t3_
+_RE_STAGE_SRC_NAME = re.compile(r'(?:l_)?s\d*_')
+_RE_STAGE_TGT_NAME = re.compile(r'(?:l_)?t\d*_')
+# Stage 이름(대문자)에서 테이블명 앞의 접두사 (뒤에 한 글자 이상 남는 경우만, 검사 순서대로 나열)
+# 번호 포함 접두사(S2_, L_S4_, T1_)는 source/target 구분 없이 확인
+_RE_STAGE_PREFIX_SRC = re.compile(r'(?:S_|L_S_|S\d+_|L_S\d+_|T\d+_)(?=.)', re.DOTALL)
+_RE_STAGE_PREFIX_TGT = re.compile(r'(?:T_|L_T_|S\d+_|L_S\d+_|T\d+_)(?=.)', re.DOTALL)
+# XMLProperties에서 테이블 추출에 쓰는 태그
+_XML_PROPERTY_TAGS = ("Context", "TableName", "SchemaName", "SelectStatement", "SQL")
+# XMLProperties 값을 감싸는 구분자
+_XML_MARKER = "=+=+=+="
+_XML_FEED_CHUNK = 2048
+
+
+class StageRecord(NamedTuple):
+    """DSRECORD에서 추출한 Stage 정보 (결과 반환 시 dict로 변환)"""
+    identifier: str
+    name: str
+    type: str
+    description: Optional[str]
+
+
+class TableRecord(NamedTuple):
+    """
+    DSRECORD에서 추출한 테이블 정보 (결과 반환 시 dict로 변환)
+    
+    schema/stage_type은 레코드마다 같은 값이 반복되므로 sys.intern으로 한 객체를 공유합니다.
+    """
+    table_name: str
+    schema: str
+    stage_name: str
+    stage_type: str
+    table_type: str
+
+
+def _records_to_dicts(records: List[NamedTuple]) -> List[Dict[str, Any]]:
+    """StageRecord/TableRecord 목록을 기존 호출부가 쓰는 dict 목록으로 변환"""
+    return [record._asdict() for record in records]
+
+
+def _detect_encoding(head: bytes) -> str:
+    """
+    파일 앞부분의 BOM으로 DSX 인코딩 판별
+    
+    Args:
+        head: 파일의 처음 몇 바이트
+    
+    Returns:
+        "utf-16" (UTF-16 LE/BE BOM), "utf-8-sig" (UTF-8 BOM), 그 외 "utf-8"
+    """
+    if head.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return "utf-16"
+    if head.startswith(b"\xef\xbb\xbf"):
+        return "utf-8-sig"
+    return "utf-8"
+
+
+def _decode_dsx_bytes(data: bytes, encoding: str) -> str:
+    """
+    판별한 인코딩으로 디코딩 (디코딩할 수 없는 바이트는 무시)
+    
+    DependencyAnalyzer/JobIndex의 utf-8, errors='ignore' 읽기와 같은 Job 이름/테이블명이 나오도록
+    다른 인코딩으로 재시도하지 않습니다.
+    """
+    return data.decode(encoding, errors='ignore')
+
+
+def _read_dsx_text(file_path: str) -> str:
+    """
+    DSX 파일을 mmap으로 열어 HEADER와 DSJOB 섹션만 디코딩
+    
+    Args:
+        file_path: DSX 파일 경로
+    
+    Returns:
+        디코딩된 DSX 내용
+    """
+    with open(file_path, 'rb') as f:
+        return _read_dsx_file(f)
+
+
+def _read_dsx_file(f: BinaryIO) -> str:
+    """
+    이미 바이너리 모드로 연 DSX 파일을 mmap으로 매핑해 HEADER와 DSJOB 섹션만 디코딩
+    
+    섹션 경계는 바이트 단위로 찾고, 실제로 파싱할 구간만 한 번씩 디코딩합니다.
+    DSJOB 섹션이 없으면 파일 전체를 디코딩합니다.
+    인코딩은 BOM으로 판별하며, UTF-16 파일은 바이트 단위 탐색이 불가하므로 전체를 디코딩합니다.
+    파일 전체를 매핑하므로 현재 읽기 위치와 관계없이 처음부터 읽습니다.
+    
+    Args:
+        f: open(..., 'rb')로 연 파일 객체
+    
+    Returns:
+        디코딩된 DSX 내용
+    """
+    if os.fstat(f.fileno()).st_size == 0:
+        return ""
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        encoding = _detect_encoding(mm[:4])
+        if encoding == "utf-16":
+            return _decode_dsx_bytes(mm[:], encoding)
+        if encoding == "utf-8-sig":
+            # BOM 3바이트는 건너뛰고 UTF-8로 디코딩
+            encoding = "utf-8"
+            start = 3
+        else:
+            start = 0
+        
+        job_start = mm.find(b"BEGIN DSJOB", start)
+        if job_start < 0:
+            return _decode_dsx_bytes(mm[start:], encoding)
+        
+        parts = []
+        header_end = mm.find(b"END HEADER", start, job_start)
+        if header_end >= 0:
+            parts.append(_decode_dsx_bytes(mm[start:header_end + len(b"END HEADER")], encoding))
+        
+        while job_start >= 0:
+            job_end = mm.find(b"END DSJOB", job_start)
+            if job_end < 0:
+                parts.append(_decode_dsx_bytes(mm[job_start:], encoding))
+                break
+            job_end += len(b"END DSJOB")
+            parts.append(_decode_dsx_bytes(mm[job_start:job_end], encoding))
+            job_start = mm.find(b"BEGIN DSJOB", job_end)
+        
+        return "\n".join(parts)
+
+
+def _load_dsx_candidate(file_path: Path) -> Optional[str]:
+    """
+    scan_directory용 파일 읽기 (스레드 풀에서 호출)
+    
+    파일을 한 번만 열어 앞 4KB의 처음 5줄로 DSX 형식인지 확인하고, 맞으면 내용을 디코딩합니다.
+    
+    Returns:
+        디코딩된 DSX 내용 또는 None (DSX 형식이 아닌 경우)
+    """
+    with open(file_path, 'rb') as f:
+        # 앞 4KB만 바이트로 읽어 처음 5줄에서 확인 (디코딩 없이)
+        first_lines = b''.join(f.read(4096).splitlines(keepends=True)[:5])
+        if b'BEGIN HEADER' not in first_lines and b'BEGIN DSJOB' not in first_lines:
+            return None  # DSX 형식이 아님
+        # mmap으로 매핑해 HEADER와 DSJOB 구간만 디코딩 (파일 전체를 문자열로 읽지 않음)
+        return _read_dsx_file(f)
+
+
+@functools.lru_cache(maxsize=None)
+def _key_patterns(key: str) -> Tuple["re.Pattern[str]", "re.Pattern[str]"]:
+    """
+    _extract_value에서 쓰는 키별 정규식 (한 줄 값, 여러 줄 값의 머리 부분) 컴파일 결과
+    
+    키 종류가 몇 개로 고정되어 있으므로 한 번 컴파일해 계속 재사용합니다.
+    키는 정규식 특수문자가 섞여도 글자 그대로 찾도록 이스케이프합니다.
+    """
+    escaped_key = re.escape(key)
+    return (
+        re.compile(rf'{escaped_key}\s+"([^"]+)"'),
+        re.compile(rf'{escaped_key}\s+Value\s'),
+    )
+
+
+def _slice_between(content: str, begin: str, end: str, start: int = 0) -> Optional[Tuple[int, int, str]]:
+    """
+    리터럴 구분자(begin ~ end) 사이의 섹션을 str.find로 탐색
+    
+    Args:
+        content: DSX 내용
+        begin: 시작 구분자 (예: "BEGIN HEADER")
+        end: 종료 구분자 (예: "END HEADER")
+        start: 탐색 시작 위치
+    
+    Returns:
+        (섹션 시작 위치, 종료 구분자 다음 위치, 내부 내용) 또는 None
+    """
+    begin_pos = content.find(begin, start)
+    if begin_pos < 0:
+        return None
+    inner_start = begin_pos + len(begin)
+    end_pos = content.find(end, inner_start)
+    if end_pos < 0:
+        return None
+    return begin_pos, end_pos + len(end), content[inner_start:end_pos].strip()
+
+
+def _iter_sections(content: str, begin: str, end: str) -> Iterator[Tuple[int, int, str]]:
+    """begin ~ end 섹션을 순서대로 반환 (겹치지 않음)"""
+    pos = 0
+    while True:
+        section = _slice_between(content, begin, end, pos)
+        if section is None:
+            return
+        yield section
+        pos = section[1]
+
+
+def _iter_dsrecords(content: str, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+    """
+    DSRECORD를 순서대로 (Identifier, 레코드 내용) 형태로 반환
+    
+    레코드 경계는 str.find로 찾고, Identifier 헤더만 시작 위치에 고정된 정규식으로 확인합니다.
+    레코드 내용은 Identifier 값 이후부터 END DSRECORD 직전까지입니다.
+    start/end를 주면 content를 잘라내지 않고 그 범위 안에서만 찾습니다.
+    """
+    if end is None:
+        end = len(content)
+    pos = start
+    while True:
+        begin_pos = content.find(_DSRECORD_BEGIN, pos, end)
+        if begin_pos < 0:
+            return
+        pos = begin_pos + len(_DSRECORD_BEGIN)
+        head = _DSRECORD_HEAD_RE.match(content, pos, end)
+        if head is None:
+            continue
+        end_pos = content.find(_DSRECORD_END, head.end(), end)
+        if end_pos < 0:
+            return
+        yield head.group(1), content[head.end():end_pos]
+        pos = end_pos + len(_DSRECORD_END)
+
+
+def _find_root_record(content: str, start: int = 0, end: Optional[int] = None) -> Optional[str]:
+    """Identifier가 "ROOT"인 첫 번째 DSRECORD의 내용(Identifier 이후 ~ END DSRECORD 전) 반환 (start~end 범위)"""
+    if end is None:
+        end = len(content)
+    pos = content.find(_ROOT_ANCHOR, start, end)
+    while pos >= 0:
+        begin_pos = content.rfind("BEGIN DSRECORD", start, pos)
+        # BEGIN DSRECORD와 Identifier "ROOT" 사이에는 공백만 있어야 함
+        if begin_pos >= 0 and not content[begin_pos + len("BEGIN DSRECORD"):pos].strip():
+            end_pos = content.find("END DSRECORD", pos, end)
+            if end_pos < 0:
+                return None
+            return content[pos + len(_ROOT_ANCHOR):end_pos]
+        pos = content.find(_ROOT_ANCHOR, pos + 1, end)
+    return None
+
+
+def _is_erp_tabledef(tabledef_value: str) -> bool:
+    """TableDef 경로가 ERP 테이블인지 확인 ("FILA"와 대소문자 무시 "ERP"를 모두 포함)"""
+    return "FILA" in tabledef_value and _RE_ERP.search(tabledef_value) is not None
+
+
+def _find_tabledef(record_content: str) -> Optional[str]:
+    """DSRECORD의 TableDef 경로 반환 (TableDef가 없으면 정규식 없이 None)"""
+    if "TableDef" not in record_content:
+        return None
+    tabledef_match = _RE_TABLEDEF.search(record_content)
+    return tabledef_match.group(1) if tabledef_match else None
+
+
+def _classify_erp_tabledef(tabledef_value: Optional[str]) -> Optional[str]:
+    """
+    TableDef 경로가 ERP 테이블을 가리키면 파라미터 형식 테이블명 반환
+    
+    예: TableDef "ODBC\\SQLServer_dev_FILA_ERP\\FILA_ERP.dbo.DW_ETL_L"
+        -> #P_ERP_MS.$P_ERP_MS_OWN_FILA_ERP#.dbo.DW_ETL_L
+    
+    Args:
+        tabledef_value: _find_tabledef로 찾은 TableDef 경로 (없으면 None)
+    
+    Returns:
+        파라미터 형식 테이블명 또는 None (ERP TableDef가 아닌 경우)
+    """
+    if not tabledef_value:
+        return None
+    is_erp_in_tabledef = _is_erp_tabledef(tabledef_value)
+    if not is_erp_in_tabledef:
+        return None
+    
+    # 경로에서 마지막 부분 추출
+    parts = tabledef_value.split("\\")
+    if len(parts) < 2 or "." not in parts[-1]:
+        return None
+    temp_schema, temp_table = parts[-1].split(".", 1)
+    
+    # dbo는 스키마가 아니므로 제거
+    if temp_schema.lower() == "dbo":
+        # FILA_ERP.dbo.DW_ETL_L -> FILA_ERP.DW_ETL_L
+        for p in parts:
+            if "FILA_ERP" in p:
+                if "FILA_ERP_DW" in p:
+                    temp_schema = "FILA_ERP_DW"
+                else:
+                    temp_schema = "FILA_ERP"
+                break
+    
+    if not temp_schema or not temp_table:
+        return None
+    # 파라미터 형식으로 변환
+    return f"#P_ERP_MS.$P_ERP_MS_OWN_{temp_schema}#.{temp_table}"
+
+
+def _strip_xml_markers(value: str) -> str:
+    """
+    값 앞뒤의 =+=+=+= 구분자 제거
+    
+    구분자 위치를 먼저 정한 뒤 한 번만 잘라 strip합니다 (구분자가 없으면 값을 그대로 반환).
+    """
+    marker_len = len(_XML_MARKER)
+    head = marker_len if value.startswith(_XML_MARKER) else 0
+    # 앞 구분자를 뗀 경우에는 끝 공백을 제외하고 뒤 구분자를 확인
+    end = len(value.rstrip()) if head else len(value)
+    has_tail = value.endswith(_XML_MARKER, head, end)
+    if not head and not has_tail:
+        return value
+    return value[head:end - marker_len if has_tail else end].strip()
+
+
+def _scan_xml_properties(xml_text: str, found: Dict[str, List[Optional[str]]], first_only: bool = False) -> Dict[str, List[Optional[str]]]:
+    """
+    XMLProperties를 조각 단위로 파싱하며 지정한 태그의 text만 수집
+    
+    트리 전체를 만들지 않고 처리한 요소는 바로 비웁니다. 루트 요소는
+    findall(".//태그")와 같이 제외합니다.
+    
+    Args:
+        xml_text: =+=+=+= 가 제거된 XMLProperties 문자열
+        found: {태그: []} 형태의 수집 대상 (파싱이 실패해도 그 전까지 찾은 값이 남음)
+        first_only: True면 모든 태그를 text가 있는 요소로 한 번씩 찾는 즉시 파싱 중단
+    
+    Returns:
+        채워진 found {태그: [text, ...]} (문서 순서, text가 없는 요소는 None)
+    
+    Raises:
+        ET.ParseError: XML 파싱 실패 시
+    """
+    remaining = set(found)
+    parser = ET.XMLPullParser(events=("start", "end"))
+    root = None
+    
+    def collect() -> bool:
+        """쌓인 이벤트 처리, 더 읽을 필요가 없으면 True"""
+        nonlocal root
+        for event, elem in parser.read_events():
+            if event == "start":
+                if root is None:
+                    root = elem
+                continue
+            if elem is root:
+                return True
+            texts = found.get(elem.tag)
+            if texts is not None:
+                texts.append(elem.text)
+                if first_only and elem.text:
+                    remaining.discard(elem.tag)
+                    if not remaining:
+                        return True
+            elem.clear()
+        return False
+    
+    # 한 번에 feed하면 조기 중단 효과가 없으므로 조각 단위로 전달
+    for pos in range(0, len(xml_text), _XML_FEED_CHUNK):
+        parser.feed(xml_text[pos:pos + _XML_FEED_CHUNK])
+        if collect():
+            return found
+    parser.close()
+    collect()
+    return found
+
+
+def _find_subrecord_end(content: str, value_start: int, end: int) -> int:
+    """
+    값 시작 위치(Value 뒤 첫 공백) 이후 공백 다음에 오는 첫 END DSSUBRECORD 위치 (없으면 -1)
+    
+    Value 뒤 공백과 END DSSUBRECORD 앞 공백은 서로 다른 문자여야 하므로 value_start + 2부터 찾습니다.
+    """
+    end_pos = content.find(_DSSUBRECORD_END, value_start + 2, end)
+    while end_pos >= 0 and not content[end_pos - 1].isspace():
+        end_pos = content.find(_DSSUBRECORD_END, end_pos + 1, end)
+    return end_pos
+
+
+def _find_xmlprops_block(record_content: str) -> Optional[str]:
+    """
+    레코드에서 XMLProperties ... Value 뒤 ~ END DSSUBRECORD 앞 내용을 str.find로 잘라 반환
+    
+    정규식(XMLProperties.*?Value\s+(?:=+=+=+=)?(.*?)(?:=+=+=+=)?\s+END DSSUBRECORD)처럼
+    위치마다 되짚지 않고 구분 문자열 위치만 찾습니다. 앞뒤에 남는 공백/'=' 구분선은
+    CDATA 탐색 결과에 영향이 없으므로 따로 떼지 않습니다.
+    """
+    xml_pos = record_content.find("XMLProperties")
+    if xml_pos < 0:
+        return None
+    end = len(record_content)
+    # XMLProperties 뒤에서 공백이 바로 따라오는 첫 Value
+    value_pos = record_content.find("Value", xml_pos + len("XMLProperties"))
+    while value_pos >= 0 and not (value_pos + 5 < end and record_content[value_pos + 5].isspace()):
+        value_pos = record_content.find("Value", value_pos + 1)
+    if value_pos < 0:
+        return None
+    value_start = value_pos + 5
+    end_pos = _find_subrecord_end(record_content, value_start, end)
+    if end_pos < 0:
+        return None
+    return record_content[value_start:end_pos]
+
+
+def _classify_stage_name(stage_name_lower: str) -> Optional[str]:
+    """
+    소문자 Stage 이름의 키워드로 "source"/"target" 판단 (키워드가 없으면 None)
+    
+    소스 키워드가 이름 어디에든 있으면 소스가 우선합니다. 두 키워드를 한 번에 찾아
+    첫 키워드가 타겟이면 그 뒤에서만 소스 키워드를 다시 찾습니다
+    (소스 키워드는 타겟 키워드 안에서 시작할 수 없음).
+    """
+    match = _RE_STAGE_KW_BASIC.search(stage_name_lower)
+    if match is None:
+        return None
+    if match.lastindex == 1 or _RE_SOURCE_KW_BASIC.search(stage_name_lower, match.end()):
+        return "source"
+    return "target"
+
+
+def _infer_table_from_stage(stage_name: str, stage_name_upper: str, table_type: str) -> Optional[str]:
+    """
+    Stage 이름의 접두사를 떼어 테이블명 추론
+    
+    예: S_CM_USER_M -> CM_USER_M, L_S4_FT_DD_SIZE_IN_RTN -> FT_DD_SIZE_IN_RTN, T_FT_MM_SIZE_INVN -> FT_MM_SIZE_INVN
+    
+    Args:
+        stage_name: Stage 이름
+        stage_name_upper: 호출자가 미리 계산한 stage_name.upper()
+        table_type: "source" 또는 "target"
+    
+    Returns:
+        추론한 테이블명 또는 None
+    """
+    if table_type == "source":
+        pattern = _RE_STAGE_PREFIX_SRC
+    elif table_type == "target":
+        pattern = _RE_STAGE_PREFIX_TGT
+    else:
+        return None
+    match = pattern.match(stage_name_upper)
+    if match is None:
+        return None
+    return stage_name[match.end():]
+
+
+def _iter_from_refs(sql_text: str) -> Iterator[str]:
+    """SQL FROM 절의 테이블 참조를 순서대로 반환 (캡처 그룹에 공백이 올 수 없으므로 별도 제거 불필요)"""
+    for from_match in _RE_FROM_CLAUSE.finditer(sql_text):
+        yield from_match.group(1)
+
+
+def _split_table_ref(table_ref: str, schema: Optional[str]) -> Tuple[str, Optional[str]]:
+    """
+    테이블 참조를 (테이블명, 스키마)로 분리
+    
+    스키마.테이블 형식이면 나누고, 스키마 부분이 파라미터(#P_ERP_MS.$P_ERP_MS_OWN_FILA_ERP#)면
+    전체를 테이블명으로 둡니다 (나중에 파라미터 매퍼가 해석).
+    스키마를 나누지 않은 경우 전달받은 schema를 그대로 반환합니다.
+    """
+    # 마지막 '.' 위치로 바로 잘라 분리 결과 튜플/리스트를 만들지 않음
+    # (스키마 부분이 '#'으로 시작하는지는 전체 참조가 '#'으로 시작하는지와 같음)
+    dot = table_ref.rfind(".")
+    if dot >= 0 and not table_ref.startswith("#"):
+        return table_ref[dot + 1:], table_ref[:dot]
+    return table_ref, schema
+
+
+def _parse_from_clause(sql_text: str, schema: Optional[str]) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    SQL의 첫 번째 FROM 절 테이블을 (테이블명, 스키마)로 반환 (FROM 절이 없으면 None)
+    
+    FROM 패턴은 앞뒤 공백과 무관하게 매칭되므로 호출 측에서 SQL을 strip()해 복사할 필요가 없습니다.
+    """
+    table_ref = next(_iter_from_refs(sql_text), None)
+    if table_ref is None:
+        return None
+    return _split_table_ref(table_ref, schema)
+
+
+def _extract_cdata(xml_text: str, tag: str) -> Optional[str]:
+    """
+    <tag ...><![CDATA[값]]></tag> 형태의 첫 번째 값을 str.find로 추출
+    
+    XML 파싱 실패 시 정규식 대신 사용합니다.
+    (<tag[^>]*><!\[CDATA\[(.*?)\]\]></tag> 와 같은 결과)
+    
+    Args:
+        xml_text: XMLProperties 문자열
+        tag: 태그 이름
+    
+    Returns:
+        CDATA 내용 (strip 전) 또는 None
+    """
+    open_tag = f"<{tag}"
+    close_tag = f"]]></{tag}>"
+    pos = xml_text.find(open_tag)
+    while pos >= 0:
+        tag_end = xml_text.find(">", pos + len(open_tag))
+        if tag_end < 0:
+            return None
+        if xml_text.startswith("<![CDATA[", tag_end + 1):
+            value_start = tag_end + 1 + len("<![CDATA[")
+            value_end = xml_text.find(close_tag, value_start)
+            if value_end < 0:
+                return None
+            return xml_text[value_start:value_end]
+        pos = xml_text.find(open_tag, pos + 1)
+    return None
+
+
+def _first_text(texts: List[Optional[str]]) -> Optional[str]:
+    """_scan_xml_properties 결과에서 text가 있는 첫 값 (strip 적용)"""
+    for text in texts:
+        if text:
+            return text.strip()
+    return None
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_dsx_file_cached(file_path: str, mtime_ns: int, size: int) -> Optional[Dict[str, Any]]:
+    """(경로, 수정 시각, 크기)를 키로 DSX 파일 파싱 결과를 캐시"""
+    content = _read_dsx_text(file_path)
+    return DSXParser().parse_dsx_content(content, file_path)
+
 
 class DSXParser:
     """DataStage Export 파일(.dsx) 파서 클래스"""
@@ -27,14 +586,21 @@ class DSXParser:
             파싱된 Job 정보 딕셔너리
         """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            return self.parse_dsx_content(content, file_path)
+            # 파일 상태(수정 시각, 크기)가 같으면 이전 파싱 결과 재사용
+            stat = os.stat(file_path)
+            job_info = _parse_dsx_file_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+            # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본 반환
+            return copy.deepcopy(job_info)
         except Exception as e:
             logger.error(f"DSX 파일 읽기 실패: {file_path} - {e}")
             return None
     
+    @staticmethod
+    def clear_cache() -> None:
+        """parse_dsx_file, scan_directory 결과 캐시 초기화"""
+        _parse_dsx_file_cached.cache_clear()
+        _scan_cache.clear()
+    
     def parse_dsx_content(self, content: str, file_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         DSX 파일 내용 파싱 (단일 Job 또는 첫 번째 Job)
@@ -63,41 +629,43 @@ class DSXParser:
             }
             
             # HEADER 섹션 파싱
-            header_match = re.search(r'BEGIN HEADER\s+(.*?)\s+END HEADER', content, re.DOTALL)
-            if header_match:
-                header_content = header_match.group(1)
+            header_section = _slice_between(content, "BEGIN HEADER", "END HEADER")
+            if header_section:
+                header_content = header_section[2]
                 job_info["server_name"] = self._extract_value(header_content, "ServerName")
                 job_info["project"] = self._extract_value(header_content, "ToolInstanceID")
             
             # DSJOB 섹션 파싱 (첫 번째 Job)
-            dsjob_match = re.search(r'BEGIN DSJOB\s+(.*?)\s+END DSJOB', content, re.DOTALL)
-            if dsjob_match:
-                dsjob_content = dsjob_match.group(1)
+            dsjob_section = _slice_between(content, "BEGIN DSJOB", "END DSJOB")
+            if dsjob_section:
+                dsjob_content = dsjob_section[2]
                 job_info["identifier"] = self._extract_value(dsjob_content, "Identifier")
                 job_info["date_modified"] = self._extract_value(dsjob_content, "DateModified")
                 job_info["time_modified"] = self._extract_value(dsjob_content, "TimeModified")
             
             # DSRECORD 섹션에서 Job 정보 추출 (첫 번째 ROOT)
-            dsrecord_match = re.search(r'BEGIN DSRECORD\s+Identifier\s+"ROOT"(.*?)END DSRECORD', content, re.DOTALL)
-            if dsrecord_match:
-                record_content = dsrecord_match.group(1)
+            record_content = _find_root_record(content)
+            if record_content is not None:
                 job_info["name"] = self._extract_value(record_content, "Name") or job_info["identifier"]
                 job_info["description"] = self._extract_value(record_content, "Description")
                 job_info["category"] = self._extract_value(record_content, "Category")
             
+            # DSRECORD는 한 번만 찾아 Stage/소스/타겟 추출에서 함께 사용
+            records = list(_iter_dsrecords(content))
+            
             # Stage 정보 추출
-            job_info["stages"] = self._extract_stages(content)
+            job_info["stages"] = _records_to_dicts(self._extract_stages(content, records=records))
             
-            # 테이블 정보 추출
-            job_info["source_tables"] = self._extract_tables(content, "source")
-            job_info["target_tables"] = self._extract_tables(content, "target")
+            # 테이블 정보 추출 (_extract_all_tables와 추출 규칙이 달라 source/target을 각각 추출)
+            job_info["source_tables"] = _records_to_dicts(self._extract_tables(content, "source", records))
+            job_info["target_tables"] = _records_to_dicts(self._extract_tables(content, "target", records))
             
             return job_info
             
         except Exception as e:
             logger.error(f"DSX 내용 파싱 실패: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(traceback.format_exc())
             return None
     
     def parse_multiple_jobs(self, content: str, file_path: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -114,233 +682,255 @@ class DSXParser:
         jobs = []
         try:
             # HEADER 섹션 파싱 (전체 파일에 하나)
-            header_match = re.search(r'BEGIN HEADER\s+(.*?)\s+END HEADER', content, re.DOTALL)
+            header_section = _slice_between(content, "BEGIN HEADER", "END HEADER")
             server_name = None
             project = None
-            if header_match:
-                header_content = header_match.group(1)
+            if header_section:
+                header_content = header_section[2]
                 server_name = self._extract_value(header_content, "ServerName")
                 project = self._extract_value(header_content, "ToolInstanceID")
             
-            # 여러 DSJOB 섹션 찾기
-            dsjob_pattern = r'BEGIN DSJOB\s+(.*?)\s+END DSJOB'
-            dsjob_matches = list(re.finditer(dsjob_pattern, content, re.DOTALL))
+            # 여러 DSJOB 섹션 찾기 (리터럴 구분자 탐색)
+            dsjob_sections = list(_iter_sections(content, "BEGIN DSJOB", "END DSJOB"))
             
-            if not dsjob_matches:
+            if not dsjob_sections:
                 # DSJOB 섹션이 없으면 단일 Job으로 처리
                 job_info = self.parse_dsx_content(content, file_path)
                 if job_info:
                     jobs.append(job_info)
                 return jobs
             
-            # 각 DSJOB 섹션별로 Job 파싱
-            for i, dsjob_match in enumerate(dsjob_matches):
+            # 각 DSJOB 섹션별로 Job 범위 계산 (다음 DSJOB까지 또는 파일 끝까지)
+            job_ranges = []
+            for i, (dsjob_start, dsjob_end, _) in enumerate(dsjob_sections):
+                if i + 1 < len(dsjob_sections):
+                    job_ranges.append((dsjob_start, dsjob_sections[i + 1][0], dsjob_end))
+                else:
+                    job_ranges.append((dsjob_start, len(content), dsjob_end))
+            
+            # 파일 이름은 Job마다 Path를 만들지 않도록 한 번만 계산
+            file_name = Path(file_path).name if file_path else 'N/A'
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            # 각 DSJOB 섹션별로 Job 파싱 (content를 복사하지 않고 위치만 전달)
+            for i, (job_start, job_end, dsjob_end) in enumerate(job_ranges):
                 try:
-                    dsjob_start = dsjob_match.start()
-                    dsjob_end = dsjob_match.end()
-                    
-                    # 다음 DSJOB까지 또는 파일 끝까지의 범위
-                    if i + 1 < len(dsjob_matches):
-                        next_dsjob_start = dsjob_matches[i + 1].start()
-                        job_content = content[dsjob_start:next_dsjob_start]
-                    else:
-                        job_content = content[dsjob_start:]
-                    
-                    # DSJOB 정보 추출
-                    dsjob_content = dsjob_match.group(1)
-                    identifier = self._extract_value(dsjob_content, "Identifier")
-                    date_modified = self._extract_value(dsjob_content, "DateModified")
-                    time_modified = self._extract_value(dsjob_content, "TimeModified")
-                    
-                    # 이 Job의 ROOT DSRECORD 찾기
-                    # ROOT는 보통 DSJOB 바로 다음에 위치
-                    root_pattern = rf'BEGIN DSRECORD\s+Identifier\s+"ROOT"(.*?)END DSRECORD'
-                    root_match = re.search(root_pattern, job_content, re.DOTALL)
-                    
-                    job_name = identifier
-                    description = None
-                    category = None
-                    
-                    if root_match:
-                        record_content = root_match.group(1)
-                        job_name = self._extract_value(record_content, "Name") or identifier
-                        description = self._extract_value(record_content, "Description")
-                        category = self._extract_value(record_content, "Category")
-                    
-                    # 이 Job의 Stage와 테이블 정보 추출
-                    stages = self._extract_stages(job_content)
-                    
-                    # 한 번에 모든 테이블 추출
-                    tables_result = self._extract_all_tables(job_content)
-                    source_tables = tables_result["source_tables"]
-                    target_tables = tables_result["target_tables"]
-                    
-                    job_info = {
-                        "name": job_name,
-                        "identifier": identifier,
-                        "description": description,
-                        "category": category,
-                        "date_modified": date_modified,
-                        "time_modified": time_modified,
-                        "server_name": server_name,
-                        "project": project,
-                        "file_path": file_path,
-                        "stages": stages,
-                        "source_tables": source_tables,
-                        "target_tables": target_tables
-                    }
-                    
-                    if job_name:
-                        jobs.append(job_info)
-                        logger.debug(f"Job 파싱 성공: {job_name} (파일: {Path(file_path).name if file_path else 'N/A'})")
-                
+                    job_info = self._parse_job_section(content, job_start, job_end, dsjob_end, server_name, project, file_path)
                 except Exception as e:
                     logger.debug(f"Job {i+1} 파싱 실패: {e}")
                     continue
+                if job_info["name"]:
+                    jobs.append(job_info)
+                    if debug_enabled:
+                        logger.debug(f"Job 파싱 성공: {job_info['name']} (파일: {file_name})")
             
-            logger.info(f"DSX 파일에서 {len(jobs)}개 Job 파싱 완료: {Path(file_path).name if file_path else 'N/A'}")
+            logger.info(f"DSX 파일에서 {len(jobs)}개 Job 파싱 완료: {file_name}")
             return jobs
             
         except Exception as e:
             logger.error(f"다중 Job 파싱 실패: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(traceback.format_exc())
             return []
     
-    def _extract_value(self, content: str, key: str) -> Optional[str]:
-        """DSX 내용에서 키 값 추출 (개선된 버전 - 여러 줄 값 지원)"""
+    def _parse_job_section(
+        self,
+        content: str,
+        job_start: int,
+        job_end: int,
+        dsjob_end: int,
+        server_name: Optional[str],
+        project: Optional[str],
+        file_path: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        DSJOB 섹션 하나를 Job 정보로 파싱
+        
+        Job 범위를 잘라내지 않고 content 안의 위치로만 다룹니다.
+        
+        Args:
+            content: DSX 파일 내용
+            job_start: BEGIN DSJOB 위치
+            job_end: 다음 BEGIN DSJOB 위치 (마지막 Job이면 content 끝)
+            dsjob_end: END DSJOB 직후 위치
+            server_name: HEADER의 ServerName
+            project: HEADER의 ToolInstanceID
+            file_path: 파일 경로 (선택)
+        
+        Returns:
+            파싱된 Job 정보 딕셔너리
+        """
+        # DSJOB 정보 추출
+        identifier = self._extract_value(content, "Identifier", job_start, dsjob_end)
+        date_modified = self._extract_value(content, "DateModified", job_start, dsjob_end)
+        time_modified = self._extract_value(content, "TimeModified", job_start, dsjob_end)
+        
+        # 이 Job의 ROOT DSRECORD 찾기
+        # ROOT는 보통 DSJOB 바로 다음에 위치
+        record_content = _find_root_record(content, job_start, job_end)
+        
+        job_name = identifier
+        description = None
+        category = None
+        
+        if record_content is not None:
+            job_name = self._extract_value(record_content, "Name") or identifier
+            description = self._extract_value(record_content, "Description")
+            category = self._extract_value(record_content, "Category")
+        
+        # 이 Job의 Stage와 테이블 정보를 DSRECORD 한 번 순회로 추출
+        extracted = self._extract_stages_and_tables(content, job_start, job_end)
+        
+        return {
+            "name": job_name,
+            "identifier": identifier,
+            "description": description,
+            "category": category,
+            "date_modified": date_modified,
+            "time_modified": time_modified,
+            "server_name": server_name,
+            "project": project,
+            "file_path": file_path,
+            "stages": _records_to_dicts(extracted["stages"]),
+            "source_tables": _records_to_dicts(extracted["source_tables"]),
+            "target_tables": _records_to_dicts(extracted["target_tables"])
+        }
+    
+    def _extract_value(self, content: str, key: str, start: int = 0, end: Optional[int] = None) -> Optional[str]:
+        """DSX 내용에서 키 값 추출 (개선된 버전 - 여러 줄 값 지원, start~end 범위)"""
+        if end is None:
+            end = len(content)
+        # 두 패턴 모두 키 문자열로 시작하므로 키가 없으면 정규식을 실행하지 않음
+        key_pos = content.find(key, start, end)
+        if key_pos < 0:
+            return None
+        pattern1, pattern2 = _key_patterns(key)
+        
         # 패턴 1: 일반적인 형식: Key "value"
-        pattern1 = rf'{key}\s+"([^"]+)"'
-        match = re.search(pattern1, content)
+        match = pattern1.search(content, key_pos, end)
         if match:
             return match.group(1)
         
         # 패턴 2: 여러 줄에 걸친 값 (Value =+=+=+= ... =+=+=+=)
         # XMLProperties 같은 경우
-        pattern2 = rf'{key}\s+Value\s+(?:=+=+=+=)?\s*(.*?)\s*(?:=+=+=+=)?\s+END DSSUBRECORD'
-        match = re.search(pattern2, content, re.DOTALL)
-        if match:
-            value = match.group(1).strip()
-            # =+=+=+= 제거
-            if value.startswith("=+=+=+="):
-                value = value[7:].strip()
-            if value.endswith("=+=+=+="):
-                value = value[:-7].strip()
-            return value
+        # 정규식은 "Key Value" 머리 부분만 찾고, 값의 끝(END DSSUBRECORD)은 find로 찾아 잘라냄
+        # (수 MB짜리 값을 lazy 정규식으로 한 글자씩 확장하며 검사하지 않도록)
+        match = pattern2.search(content, key_pos, end)
+        if match is None:
+            return None
+        value_start = match.end() - 1
+        # 값과 END DSSUBRECORD 사이에는 공백이 하나 이상 있어야 함
+        end_pos = _find_subrecord_end(content, value_start, end)
+        if end_pos < 0:
+            return None
+        value = content[value_start:end_pos].strip()
+        # 값 앞뒤의 4개 이상 연속된 '=' 구분선 제거
+        trimmed = value.lstrip("=")
+        if len(value) - len(trimmed) >= 4:
+            value = trimmed
+        trimmed = value.rstrip("=")
+        if len(value) - len(trimmed) >= 4:
+            value = trimmed
+        # =+=+=+= 제거
+        return _strip_xml_markers(value.strip())
+    
+    def _extract_stages_and_tables(
+        self,
+        content: str,
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> Dict[str, List[NamedTuple]]:
+        """
+        Stage와 테이블 정보를 DSRECORD 한 번 순회로 추출 (start~end 범위)
         
-        return None
+        테이블 추출이 레코드마다 읽는 OLEType/Name으로 Stage도 함께 만듭니다.
+        테이블 추출이 중간에 끝나면 남은 레코드는 Stage만 이어서 추출합니다.
+        
+        Returns:
+            {"stages": [...], "source_tables": [...], "target_tables": [...]} 딕셔너리
+        """
+        stages = []
+        records = _iter_dsrecords(content, start, end)
+        extracted = self._extract_all_tables(content, records=records, stages=stages)
+        stages.extend(self._extract_stages(content, records=records))
+        extracted["stages"] = stages
+        return extracted
     
-    def _extract_stages(self, content: str) -> List[Dict[str, Any]]:
-        """Stage 정보 추출"""
+    def _extract_stages(
+        self,
+        content: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        records: Optional[Iterable[Tuple[str, str]]] = None
+    ) -> List[StageRecord]:
+        """Stage 정보 추출 (start~end 범위, records를 주면 이미 찾은 DSRECORD 목록 사용)"""
         stages = []
         try:
+            if records is None:
+                records = _iter_dsrecords(content, start, end)
             # DSRECORD에서 Stage 찾기
-            stage_pattern = r'BEGIN DSRECORD\s+Identifier\s+"([^"]+)"(.*?)END DSRECORD'
-            for match in re.finditer(stage_pattern, content, re.DOTALL):
-                identifier = match.group(1)
-                record_content = match.group(2)
+            for identifier, record_content in records:
                 
                 # Stage 타입 확인
                 olet_type = self._extract_value(record_content, "OLEType")
                 if olet_type and "Stage" in olet_type:
                     stage_name = self._extract_value(record_content, "Name") or identifier
-                    stages.append({
-                        "identifier": identifier,
-                        "name": stage_name,
-                        "type": olet_type,
-                        "description": self._extract_value(record_content, "Description")
-                    })
+                    stages.append(self._stage_record(identifier, record_content, olet_type, stage_name))
         except Exception as e:
             logger.debug(f"Stage 추출 중 오류: {e}")
         
         return stages
     
-    def _extract_tables(self, content: str, table_type: str) -> List[Dict[str, Any]]:
-        """테이블 정보 추출 (개선된 버전 - XMLProperties 지원)"""
+    def _stage_record(self, identifier: str, record_content: str, olet_type: str, stage_name: str) -> StageRecord:
+        """이미 읽은 OLEType/Name으로 Stage 레코드 생성"""
+        return StageRecord(
+            identifier=identifier,
+            name=stage_name,
+            type=sys.intern(olet_type),
+            description=self._extract_value(record_content, "Description")
+        )
+    
+    def _extract_tables(
+        self,
+        content: str,
+        table_type: str,
+        records: Optional[List[Tuple[str, str]]] = None
+    ) -> List[TableRecord]:
+        """테이블 정보 추출 (개선된 버전 - XMLProperties 지원, records를 주면 이미 찾은 DSRECORD 목록 사용)"""
         tables = []
         try:
-            import xml.etree.ElementTree as ET
-            
+            if records is None:
+                records = _iter_dsrecords(content)
             # 모든 DSRECORD 찾기
-            stage_pattern = r'BEGIN DSRECORD\s+Identifier\s+"([^"]+)"(.*?)END DSRECORD'
-            for match in re.finditer(stage_pattern, content, re.DOTALL):
-                identifier = match.group(1)
-                record_content = match.group(2)
+            for identifier, record_content in records:
                 
                 olet_type = self._extract_value(record_content, "OLEType")
                 stage_name = self._extract_value(record_content, "Name") or identifier
                 stage_type = self._extract_value(record_content, "StageType") or ""
+                # 대소문자 변환은 레코드당 한 번만 (방법 5와 Context 없는 경우의 필터링에서 재사용)
+                stage_name_lower = stage_name.lower()
+                stage_name_upper = stage_name.upper()
                 
-                # CCustomStage, CCustomInput, CCustomOutput 등 확인
-                is_custom_stage = olet_type and ("CCustom" in olet_type or "Stage" in olet_type)
+                # Connector/ODBC Stage 확인 (방법 5에서 사용)
                 is_connector = stage_type and ("Connector" in stage_type or "ODBC" in stage_type)
                 
                 table_name = None
                 schema = None
+                # TableDef 경로는 레코드당 한 번만 찾아 방법 0과 방법 3에서 함께 사용
+                tabledef_value = _find_tabledef(record_content)
                 
                 # 방법 0: TableDef에서 ERP 테이블 먼저 찾기 (가장 우선, XMLProperties 전)
                 if table_type == "source":
-                    tabledef_match = re.search(r'TableDef\s+"([^"]+)"', record_content)
-                    if tabledef_match:
-                        tabledef_value = tabledef_match.group(1)
-                        is_erp_in_tabledef = "FILA_ERP" in tabledef_value or ("ERP" in tabledef_value.upper() and "FILA" in tabledef_value)
-                        
-                        if is_erp_in_tabledef:
-                            # 경로에서 마지막 부분 추출
-                            parts = tabledef_value.split("\\")
-                            if len(parts) >= 2:
-                                last_part = parts[-1]
-                                if "." in last_part:
-                                    schema_table = last_part.split(".", 1)
-                                    if len(schema_table) == 2:
-                                        temp_schema = schema_table[0]
-                                        temp_table = schema_table[1]
-                                        
-                                        # dbo는 스키마가 아니므로 제거
-                                        if temp_schema.lower() == "dbo":
-                                            # FILA_ERP.dbo.DW_ETL_L -> FILA_ERP.DW_ETL_L
-                                            for p in parts:
-                                                if "FILA_ERP" in p:
-                                                    if "FILA_ERP_DW" in p:
-                                                        temp_schema = "FILA_ERP_DW"
-                                                    else:
-                                                        temp_schema = "FILA_ERP"
-                                                    break
-                                        
-                                        if temp_schema and temp_table:
-                                            # 파라미터 형식으로 변환하여 저장
-                                            table_name_param = f"#P_ERP_MS.$P_ERP_MS_OWN_{temp_schema}#.{temp_table}"
-                                            # 바로 추가하고 다음 레코드로
-                                            tables.append({
-                                                "table_name": table_name_param,
-                                                "schema": "",
-                                                "stage_name": stage_name,
-                                                "stage_type": olet_type or stage_type or "Unknown",
-                                                "table_type": table_type
-                                            })
-                                            # 다음 레코드로 이동
-                                            continue
-                
-                # Context 변수 초기화 (먼저 XMLProperties에서 Context 확인)
-                context_value = None
-                xml_properties = self._extract_value(record_content, "XMLProperties")
-                
-                # 먼저 XMLProperties에서 Context 확인 (방법 1에서 찾은 테이블도 필터링하기 위해)
-                if xml_properties:
-                    # =+=+=+= 로 감싸진 경우 처리
-                    xml_props_for_context = xml_properties
-                    if xml_props_for_context.startswith("=+=+=+="):
-                        xml_props_for_context = xml_props_for_context[7:].strip()
-                    if xml_props_for_context.endswith("=+=+=+="):
-                        xml_props_for_context = xml_props_for_context[:-7].strip()
-                    
-                    try:
-                        root_context = ET.fromstring(xml_props_for_context)
-                        context_elem = root_context.find(".//Context")
-                        if context_elem is not None and context_elem.text:
-                            context_value = context_elem.text.strip()
-                    except:
-                        pass
+                    erp_tabledef_table = _classify_erp_tabledef(tabledef_value)
+                    if erp_tabledef_table:
+                        # 바로 추가하고 다음 레코드로
+                        tables.append(TableRecord(
+                            table_name=erp_tabledef_table,
+                            schema="",
+                            stage_name=stage_name,
+                            stage_type=sys.intern(olet_type or stage_type or "Unknown"),
+                            table_type=table_type
+                        ))
+                        continue
                 
                 # 방법 1: 직접 TableName 필드 찾기 (기존 방식)
                 table_name = self._extract_value(record_content, "TableName")
@@ -349,94 +939,45 @@ class DSXParser:
                 # 방법 1에서 테이블을 찾은 경우, 방법 2는 건너뛰기 (중복 방지)
                 method1_table_found = table_name is not None
                 
-                # 방법 2: XMLProperties에서 TableName 추출 및 Context 확인
-                if xml_properties and not method1_table_found:
+                # XMLProperties는 한 번만 파싱해 Context와 방법 2에 필요한 값을 함께 수집
+                # (방법 1에서 찾은 테이블도 Context로 필터링해야 하므로 Context는 항상 확인)
+                context_value = None
+                xml_error = None
+                xml_properties = self._extract_value(record_content, "XMLProperties")
+                if xml_properties:
                     # =+=+=+= 로 감싸진 경우 처리
-                    if xml_properties.startswith("=+=+=+="):
-                        xml_properties = xml_properties[7:].strip()
-                    if xml_properties.endswith("=+=+=+="):
-                        xml_properties = xml_properties[:-7].strip()
+                    xml_properties = _strip_xml_markers(xml_properties)
                     
+                    # ElementTree는 CDATA를 자동으로 처리하므로 text 속성에서 바로 값을 가져올 수 있음
+                    # 방법 2를 건너뛰면 Context만 필요하므로 찾는 즉시 파싱 중단
+                    scan_tags = ("Context",) if method1_table_found else _XML_PROPERTY_TAGS
+                    xml_texts = {tag: [] for tag in scan_tags}
                     try:
-                        # XML 파싱
-                        # ElementTree는 CDATA를 자동으로 처리하므로 text 속성에서 바로 값을 가져올 수 있음
-                        root = ET.fromstring(xml_properties)
-                        
-                        # Context 확인 (source/target 구분)
-                        # Context는 XMLProperties 안에 숫자로 저장됨: 1 = source, 2 = target
-                        # 이미 위에서 확인했지만, 다시 확인 (혹시 모를 경우를 위해)
-                        if not context_value:
-                            context_elem = root.find(".//Context")
-                            if context_elem is not None and context_elem.text:
-                                context_value = context_elem.text.strip()
-                        
-                        # 먼저 TableDef에서 ERP 테이블 찾기 (Context 필터링 전, 가장 우선)
-                        # TableDef는 DSRECORD 레벨에 있으므로 record_content에서 찾기
-                        tabledef_match = re.search(r'TableDef\s+"([^"]+)"', record_content)
-                        if tabledef_match and table_type == "source":
-                            tabledef_value = tabledef_match.group(1)
-                            is_erp_in_tabledef = "FILA_ERP" in tabledef_value or ("ERP" in tabledef_value.upper() and "FILA" in tabledef_value)
-                            
-                            if is_erp_in_tabledef:
-                                # 경로에서 마지막 부분 추출
-                                parts = tabledef_value.split("\\")
-                                if len(parts) >= 2:
-                                    last_part = parts[-1]
-                                    if "." in last_part:
-                                        schema_table = last_part.split(".", 1)
-                                        if len(schema_table) == 2:
-                                            temp_schema = schema_table[0]
-                                            temp_table = schema_table[1]
-                                            
-                                            # dbo는 스키마가 아니므로 제거
-                                            if temp_schema.lower() == "dbo":
-                                                # FILA_ERP.dbo.DW_ETL_L -> FILA_ERP.DW_ETL_L
-                                                for p in parts:
-                                                    if "FILA_ERP" in p:
-                                                        # FILA_ERP 또는 FILA_ERP_DW 추출
-                                                        if "FILA_ERP_DW" in p:
-                                                            temp_schema = "FILA_ERP_DW"
-                                                        else:
-                                                            temp_schema = "FILA_ERP"
-                                                        break
-                                            
-                                            if temp_schema and temp_table:
-                                                # 파라미터 형식으로 변환하여 저장
-                                                # FILA_ERP.DW_ETL_L -> #P_ERP_MS.$P_ERP_MS_OWN_FILA_ERP#.DW_ETL_L
-                                                table_name = f"#P_ERP_MS.$P_ERP_MS_OWN_{temp_schema}#.{temp_table}"
-                                                schema = ""
-                                                # ERP 테이블은 보통 소스이므로 Context 필터링 없이 바로 추가하지 않고
-                                                # table_name을 설정하고 나중에 Context 필터링을 거치도록 함
-                                                # (다음 레코드로 이동하지 않고 계속 진행하여 Context 필터링을 거침)
-                                                break
-                        
+                        _scan_xml_properties(xml_properties, xml_texts, first_only=method1_table_found)
+                    except Exception as e:
+                        xml_error = e
+                    
+                    # Context 확인 (source/target 구분)
+                    # Context는 XMLProperties 안에 숫자로 저장됨: 1 = source, 2 = target
+                    # 파싱이 중간에 실패해도 그 전에 읽은 Context는 사용
+                    context_texts = xml_texts["Context"]
+                    if context_texts and context_texts[0]:
+                        context_value = context_texts[0].strip()
+                
+                # 방법 2: XMLProperties에서 TableName 추출
+                if xml_properties and not method1_table_found:
+                    if xml_error is None:
                         # 먼저 SelectStatement에서 ERP 테이블 찾기 (Context 필터링 전)
                         # ERP 테이블은 보통 소스이므로 소스 타입일 때만 찾기
                         if table_type == "source" and not table_name:
-                            for sql_elem in root.findall(".//SelectStatement"):
-                                if sql_elem.text:
-                                    sql_text = sql_elem.text.strip()
+                            for sql_text in xml_texts["SelectStatement"]:
+                                if sql_text:
                                     # FROM 절에서 ERP 테이블 추출
-                                    from_matches = re.findall(r'FROM\s+([^\s,;]+(?:\.[^\s,;]+)*)', sql_text, re.IGNORECASE | re.DOTALL)
-                                    for from_match in from_matches:
-                                        table_ref = from_match.strip()
-                                        table_ref = re.sub(r'\s+', '', table_ref)
-                                        
+                                    for table_ref in _iter_from_refs(sql_text):
                                         # ERP 테이블인지 확인
-                                        if "#P_ERP" in table_ref or ("ERP" in table_ref.upper() and "." in table_ref):
+                                        if "#P_ERP" in table_ref or ("." in table_ref and _RE_ERP.search(table_ref)):
                                             # ERP 테이블 발견 - 파라미터 형식 처리
-                                            if "." in table_ref:
-                                                parts = table_ref.rsplit(".", 1)
-                                                if len(parts) == 2:
-                                                    if parts[0].startswith("#"):
-                                                        table_name = table_ref
-                                                    else:
-                                                        table_name = parts[1]
-                                                        schema = parts[0]
-                                                else:
-                                                    table_name = table_ref
-                                            else:
-                                                table_name = table_ref
+                                            table_name, schema = _split_table_ref(table_ref, schema)
                                             
                                             # ERP 테이블을 찾았으면 table_name을 설정하고 계속 진행
                                             # (Context 필터링을 거치도록 함)
@@ -445,174 +986,85 @@ class DSXParser:
                                     if table_name:  # ERP 테이블을 찾은 경우
                                         break
                         
-                        # ERP 테이블인지 확인 (TableName 기준)
-                        is_erp_table = False
-                        temp_table_name = None
-                        for table_elem in root.findall(".//TableName"):
-                            if table_elem.text:
-                                temp_table_name = table_elem.text.strip()
-                                if "#P_ERP" in temp_table_name or "ERP" in temp_table_name.upper():
-                                    is_erp_table = True
-                                break
-                        
                         # TableName 찾기 (Context 확인 전에 먼저 찾기)
                         if not table_name:  # SelectStatement에서 찾지 못한 경우만
-                            for table_elem in root.findall(".//TableName"):
-                                if table_elem.text:
-                                    table_name = table_elem.text.strip()
-                                    break
+                            table_name = _first_text(xml_texts["TableName"])
                         
                         # 방법 2에서는 테이블만 찾고, Context 필터링은 마지막에 한 번만 적용
                         
                         # SchemaName 찾기 (있는 경우)
                         if not schema:
-                            for schema_elem in root.findall(".//SchemaName"):
-                                if schema_elem.text:
-                                    schema = schema_elem.text.strip()
-                                    break
+                            schema = _first_text(xml_texts["SchemaName"])
                         
                         # SQL 문에서 테이블 추출 (TableName이 없는 경우, ERP가 아닌 경우)
                         if not table_name:
                             # SelectStatement 찾기
-                            for sql_elem in root.findall(".//SelectStatement"):
-                                if sql_elem.text:
-                                    sql_text = sql_elem.text.strip()
+                            for sql_text in xml_texts["SelectStatement"]:
+                                if sql_text:
                                     # FROM 절에서 테이블 추출
                                     # FROM #P_ERP_MS.$P_ERP_MS_OWN_FILA_ERP#.WM_WRHS_M 같은 패턴
-                                    # 여러 줄에 걸쳐 있을 수 있으므로 DOTALL 사용
                                     # 여러 테이블이 있을 수 있으므로 모두 찾기
-                                    from_matches = re.findall(r'FROM\s+([^\s,;]+(?:\.[^\s,;]+)*)', sql_text, re.IGNORECASE | re.DOTALL)
-                                    for from_match in from_matches:
-                                        table_ref = from_match.strip()
-                                        # 개행 문자 제거
-                                        table_ref = re.sub(r'\s+', '', table_ref)
-                                        
+                                    for table_ref in _iter_from_refs(sql_text):
                                         # ERP 테이블인지 확인
-                                        is_erp_in_sql = "#P_ERP" in table_ref or "ERP" in table_ref.upper()
+                                        is_erp_in_sql = _RE_ERP.search(table_ref) is not None
                                         
-                                        # ERP 테이블이고 소스 타입인 경우만 처리
-                                        if is_erp_in_sql and table_type == "source":
-                                            # 파라미터 형식: #P_ERP_MS.$P_ERP_MS_OWN_FILA_ERP#.WM_WRHS_M
-                                            # 또는 일반 스키마.테이블 형식
-                                            if "." in table_ref:
-                                                parts = table_ref.rsplit(".", 1)
-                                                if len(parts) == 2:
-                                                    # 스키마 부분이 파라미터인 경우 전체를 table_name으로 저장
-                                                    if parts[0].startswith("#"):
-                                                        # 파라미터 전체를 table_name으로 저장 (나중에 파라미터 매퍼가 해석)
-                                                        table_name = table_ref
-                                                    else:
-                                                        # 일반 스키마.테이블 형식
-                                                        table_name = parts[1]
-                                                        schema = parts[0]
-                                            else:
-                                                table_name = table_ref
-                                            break
-                                        elif not is_erp_in_sql:
-                                            # ERP가 아닌 경우 기존 로직 사용
-                                            if "." in table_ref:
-                                                parts = table_ref.rsplit(".", 1)
-                                                if len(parts) == 2:
-                                                    if parts[0].startswith("#"):
-                                                        table_name = table_ref
-                                                    else:
-                                                        table_name = parts[1]
-                                                        schema = parts[0]
-                                            else:
-                                                table_name = table_ref
+                                        # ERP 테이블은 소스 타입인 경우만 처리, ERP가 아닌 경우는 기존 로직 사용
+                                        if not is_erp_in_sql or table_type == "source":
+                                            table_name, schema = _split_table_ref(table_ref, schema)
                                             break
                                     if table_name:
                                         break
                             
                             # SQL 필드도 확인
                             if not table_name:
-                                for sql_elem in root.findall(".//SQL"):
-                                    if sql_elem.text:
-                                        sql_text = sql_elem.text.strip()
-                                        from_match = re.search(r'FROM\s+([^\s,;]+(?:\.[^\s,;]+)*)', sql_text, re.IGNORECASE | re.DOTALL)
-                                        if from_match:
-                                            table_ref = from_match.group(1).strip()
-                                            table_ref = re.sub(r'\s+', '', table_ref)
-                                            if "." in table_ref:
-                                                parts = table_ref.rsplit(".", 1)
-                                                if len(parts) == 2:
-                                                    # 스키마 부분이 파라미터인 경우 전체를 table_name으로 저장
-                                                    if parts[0].startswith("#"):
-                                                        table_name = table_ref
-                                                    else:
-                                                        table_name = parts[1]
-                                                        schema = parts[0]
-                                            else:
-                                                table_name = table_ref
+                                for sql_text in xml_texts["SQL"]:
+                                    if sql_text:
+                                        from_table = _parse_from_clause(sql_text, schema)
+                                        if from_table:
+                                            table_name, schema = from_table
                                             break
-                                if table_name:
-                                    break
                     
-                    except (ET.ParseError, UnicodeDecodeError) as e:
-                            logger.debug(f"XML 파싱 실패: {e}")
+                    else:
+                            logger.debug(f"XML 파싱 실패: {xml_error}")
                             # XML 파싱 실패 시 정규식으로 시도
                             # CDATA 안의 내용은 여러 줄일 수 있고 ]가 포함될 수 있으므로 더 정확한 패턴 사용
-                            table_match = re.search(r'<TableName[^>]*><!\[CDATA\[(.*?)\]\]></TableName>', xml_properties, re.DOTALL)
-                            if table_match:
-                                table_name = table_match.group(1).strip()
+                            table_cdata = _extract_cdata(xml_properties, "TableName")
+                            if table_cdata is not None:
+                                table_name = table_cdata.strip()
                             
-                            schema_match = re.search(r'<SchemaName[^>]*><!\[CDATA\[(.*?)\]\]></SchemaName>', xml_properties, re.DOTALL)
-                            if schema_match:
-                                schema = schema_match.group(1).strip()
+                            schema_cdata = _extract_cdata(xml_properties, "SchemaName")
+                            if schema_cdata is not None:
+                                schema = schema_cdata.strip()
                             
                             # SQL 문에서 테이블 추출 (XML 파싱 실패 시)
                             if not table_name:
                                 # SelectStatement CDATA 찾기
-                                select_match = re.search(r'<SelectStatement[^>]*><!\[CDATA\[(.*?)\]\]></SelectStatement>', xml_properties, re.DOTALL)
-                                if select_match:
-                                    sql_text = select_match.group(1).strip()
-                                    from_match = re.search(r'FROM\s+([^\s,;]+(?:\.[^\s,;]+)*)', sql_text, re.IGNORECASE | re.DOTALL)
-                                    if from_match:
-                                        table_ref = from_match.group(1).strip()
-                                        table_ref = re.sub(r'\s+', '', table_ref)
-                                        if "." in table_ref:
-                                            parts = table_ref.rsplit(".", 1)
-                                            if len(parts) == 2:
-                                                # 스키마 부분이 파라미터인 경우 전체를 table_name으로 저장
-                                                if parts[0].startswith("#"):
-                                                    table_name = table_ref
-                                                else:
-                                                    table_name = parts[1]
-                                                    schema = parts[0]
-                                        else:
-                                            table_name = table_ref
+                                select_cdata = _extract_cdata(xml_properties, "SelectStatement")
+                                if select_cdata is not None:
+                                    from_table = _parse_from_clause(select_cdata, schema)
+                                    if from_table:
+                                        table_name, schema = from_table
                                 
                                 # SQL 필드도 확인
                                 if not table_name:
-                                    sql_match = re.search(r'<SQL[^>]*><!\[CDATA\[(.*?)\]\]></SQL>', xml_properties, re.DOTALL)
-                                    if sql_match:
-                                        sql_text = sql_match.group(1).strip()
-                                        from_match = re.search(r'FROM\s+([^\s,;]+(?:\.[^\s,;]+)*)', sql_text, re.IGNORECASE | re.DOTALL)
-                                        if from_match:
-                                            table_ref = from_match.group(1).strip()
-                                            table_ref = re.sub(r'\s+', '', table_ref)
-                                            if "." in table_ref:
-                                                parts = table_ref.rsplit(".", 1)
-                                                if len(parts) == 2:
-                                                    # 스키마 부분이 파라미터인 경우 전체를 table_name으로 저장
-                                                    if parts[0].startswith("#"):
-                                                        table_name = table_ref
-                                                    else:
-                                                        table_name = parts[1]
-                                                        schema = parts[0]
-                                            else:
-                                                table_name = table_ref
+                                    sql_cdata = _extract_cdata(xml_properties, "SQL")
+                                    if sql_cdata is not None:
+                                        from_table = _parse_from_clause(sql_cdata, schema)
+                                        if from_table:
+                                            table_name, schema = from_table
+                
+                # 타겟 요청인데 Context가 타겟(2)이 아니면 이후 방법으로 테이블을 찾아도 마지막에 제외되므로
+                # 방법 3~5를 실행하지 않음 (소스는 ERP 테이블 예외가 있어 테이블명을 알아야 판단 가능)
+                if table_type == "target" and context_value and context_value != "2":
+                    continue
                 
                 # 방법 3: TableDef 필드에서 테이블 추출 (ERP 테이블 등)
                 if not table_name:
                     # TableDef "ODBC\\SQLServer_dev_FILA_ERP\\FILA_ERP.dbo.DW_ETL_L"
                     # TableDef "Database\\ERPDEV2\\BIDWADM.CD_DAY_NM"
-                    tabledef_match = re.search(r'TableDef\s+"([^"]+)"', record_content)
-                    if tabledef_match:
-                        tabledef_value = tabledef_match.group(1)
-                        
+                    if tabledef_value:
                         # ERP 관련 확인
-                        is_erp_in_tabledef = "FILA_ERP" in tabledef_value or ("ERP" in tabledef_value.upper() and "FILA" in tabledef_value)
+                        is_erp_in_tabledef = _is_erp_tabledef(tabledef_value)
                         
                         # ERP 테이블이고 소스 타입인 경우만 처리
                         if is_erp_in_tabledef and table_type == "source":
@@ -651,34 +1103,30 @@ class DSXParser:
                                             # schema는 이미 설정됨
                         
                         # Vertica 테이블도 처리 (BIDW 관련)
-                        elif "BIDW" in tabledef_value.upper() and not is_erp_in_tabledef:
+                        elif not is_erp_in_tabledef and _RE_BIDW.search(tabledef_value):
                             parts = tabledef_value.split("\\")
                             if len(parts) >= 2:
-                                last_part = parts[-1]
-                                if "." in last_part:
-                                    schema_table = last_part.split(".", 1)
-                                    if len(schema_table) == 2:
-                                        schema = schema_table[0]
-                                        table = schema_table[1]
-                                        table_name = table
+                                schema_part, sep, table_part = parts[-1].partition(".")
+                                if sep:
+                                    schema = schema_part
+                                    table_name = table_part
                         
                         # 방법 3에서는 테이블만 찾고, Context 필터링은 마지막에 한 번만 적용
                 
                 # 방법 4: 정규식으로 직접 찾기 (XML 파싱 실패 시)
                 if not table_name:
                     # XMLProperties 전체에서 TableName CDATA 찾기
-                    xml_properties_match = re.search(r'XMLProperties.*?Value\s+(?:=+=+=+=)?(.*?)(?:=+=+=+=)?\s+END DSSUBRECORD', record_content, re.DOTALL)
-                    if xml_properties_match:
-                        xml_content = xml_properties_match.group(1)
+                    xml_content = _find_xmlprops_block(record_content)
+                    if xml_content is not None:
                         # CDATA 안의 내용은 여러 줄일 수 있고 ]가 포함될 수 있으므로 더 정확한 패턴 사용
-                        table_match = re.search(r'<TableName[^>]*><!\[CDATA\[(.*?)\]\]></TableName>', xml_content, re.DOTALL)
-                        if table_match:
-                            table_name = table_match.group(1).strip()
+                        table_cdata = _extract_cdata(xml_content, "TableName")
+                        if table_cdata is not None:
+                            table_name = table_cdata.strip()
                 
                         # 방법 4에서는 테이블만 찾고, Context 필터링은 마지막에 한 번만 적용
                         # Context가 없었던 경우 다시 확인
                         if table_name and not context_value:
-                            context_match = re.search(r'<Context[^>]*>(\d+)</Context>', xml_content)
+                            context_match = _RE_CONTEXT_TAG.search(xml_content)
                             if context_match:
                                 context_value = context_match.group(1).strip()
                 
@@ -687,30 +1135,7 @@ class DSXParser:
                 if not table_name and is_connector and stage_name:
                     # Stage 이름 예시:
                     #   S_CM_USER_M, S2_OD_WM_INVN_MNTH, L_S4_FT_DD_SIZE_IN_RTN, T_FT_MM_SIZE_INVN
-                    stage_name_upper = stage_name.upper()
-                    
-                    def _infer_from_stage(prefixes):
-                        upper = stage_name_upper
-                        for prefix in prefixes:
-                            if upper.startswith(prefix) and len(stage_name) > len(prefix):
-                                return stage_name[len(prefix):]
-                        # S2_, S10_ 등 숫자 포함 패턴
-                        match = re.match(r'(S\d+_)', upper)
-                        if match and len(stage_name) > len(match.group(1)):
-                            return stage_name[len(match.group(1)):]
-                        match_l = re.match(r'(L_S\d+_)', upper)
-                        if match_l and len(stage_name) > len(match_l.group(1)):
-                            return stage_name[len(match_l.group(1)):]
-                        match_t = re.match(r'(T\d+_)', upper)
-                        if match_t and len(stage_name) > len(match_t.group(1)):
-                            return stage_name[len(match_t.group(1)):]
-                        return None
-                    
-                    inferred_table = None
-                    if table_type == "source":
-                        inferred_table = _infer_from_stage(["S_", "L_S_"])
-                    elif table_type == "target":
-                        inferred_table = _infer_from_stage(["T_", "L_T_"])
+                    inferred_table = _infer_table_from_stage(stage_name, stage_name_upper, table_type)
                     
                     if inferred_table:
                         # ERP 테이블일 가능성이 높으므로 스키마는 나중에 정규화 과정에서 보정
@@ -722,7 +1147,7 @@ class DSXParser:
                     # Context 필터링: 모든 방법에서 찾은 테이블에 대해 마지막에 한 번만 적용
                     if context_value:
                         # ERP 테이블인지 확인
-                        is_erp_table = "#P_ERP" in table_name or "ERP" in table_name.upper()
+                        is_erp_table = _RE_ERP.search(table_name) is not None
                         
                         # Context 필터링: 1 = source, 2 = target
                         if table_type == "source" and context_value != "1":
@@ -733,23 +1158,15 @@ class DSXParser:
                             continue  # 필터링: 타겟이 아닌 경우 제외
                     else:
                         # Context가 없는 경우: Stage 이름으로 판단
-                        stage_name_lower = (stage_name or "").lower()
-                        
                         # Stage 이름에 "source", "input", "read", "from", "_s_", "s_" 등이 있으면 소스로 간주
                         is_source_stage = (
-                            any(keyword in stage_name_lower for keyword in ["source", "input", "read", "from", "_s_", "_src"]) or
-                            stage_name_lower.startswith("s_") or
-                            stage_name_lower.startswith("l_s_") or
-                            re.match(r's\d+_', stage_name_lower) is not None or
-                            re.match(r'l_s\d+_', stage_name_lower) is not None
+                            _RE_SOURCE_KW.search(stage_name_lower) is not None or
+                            _RE_STAGE_SRC_NAME.match(stage_name_lower) is not None
                         )
                         # Stage 이름에 "target", "output", "write", "to", "_t_", "_tgt" 등이 있으면 타겟으로 간주
                         is_target_stage = (
-                            any(keyword in stage_name_lower for keyword in ["target", "output", "write", "to", "_t_", "_tgt"]) or
-                            stage_name_lower.startswith("t_") or
-                            stage_name_lower.startswith("l_t_") or
-                            re.match(r't\d+_', stage_name_lower) is not None or
-                            re.match(r'l_t\d+_', stage_name_lower) is not None
+                            _RE_TARGET_KW.search(stage_name_lower) is not None or
+                            _RE_STAGE_TGT_NAME.match(stage_name_lower) is not None
                         )
                         
                         # Stage 이름으로 판단 가능한 경우만 필터링
@@ -764,15 +1181,12 @@ class DSXParser:
                     # 파라미터 형식 처리: #P_DW_VER.$P_DW_VER_OWN_BIDWADM#.FT_AS_ACCP_RSLT
                     # 또는 일반 형식: SCHEMA.TABLE
                     original_table_name = table_name
-                    if "." in table_name and not schema:
-                        parts = table_name.rsplit(".", 1)
-                        if len(parts) == 2:
-                            potential_schema = parts[0]
-                            potential_table = parts[1]
-                            # 스키마가 파라미터가 아닌 실제 값인 경우
-                            if not potential_schema.startswith("#") and potential_table:
-                                schema = potential_schema
-                                table_name = potential_table
+                    if not schema:
+                        potential_schema, sep, potential_table = table_name.rpartition(".")
+                        # 스키마가 파라미터가 아닌 실제 값인 경우
+                        if sep and potential_table and not potential_schema.startswith("#"):
+                            schema = potential_schema
+                            table_name = potential_table
                     
                     # 테이블명이 파라미터로 끝나는 경우 (예: #P_DW_VER.$P_DW_VER_OWN_BIDWADM_CO#.)
                     # 이런 경우는 실제 테이블명이 없으므로 스킵
@@ -781,27 +1195,38 @@ class DSXParser:
                     
                     # 테이블명이 실제로 있는 경우만 추가
                     if table_name and table_name.strip():
-                        tables.append({
-                            "table_name": table_name,
-                            "schema": schema or "",
-                            "stage_name": stage_name,
-                            "stage_type": olet_type or stage_type or "Unknown",
-                            "table_type": table_type
-                        })
+                        tables.append(TableRecord(
+                            table_name=table_name,
+                            schema=sys.intern(schema or ""),
+                            stage_name=stage_name,
+                            stage_type=sys.intern(olet_type or stage_type or "Unknown"),
+                            table_type=table_type
+                        ))
                 
         except Exception as e:
             logger.debug(f"테이블 추출 중 오류: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(traceback.format_exc())
         
         return tables
     
-    def _extract_all_tables(self, content: str) -> Dict[str, List[Dict[str, Any]]]:
+    def _extract_all_tables(
+        self,
+        content: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        records: Optional[Iterable[Tuple[str, str]]] = None,
+        stages: Optional[List[StageRecord]] = None
+    ) -> Dict[str, List[TableRecord]]:
         """
         모든 테이블 정보를 한 번에 추출 (source/target 구분)
         
         Args:
             content: DSX 파일 내용
+            start: 탐색 시작 위치
+            end: 탐색 종료 위치 (None이면 content 끝)
+            records: 이미 찾은 (Identifier, 레코드 내용) 목록 (None이면 start~end에서 직접 찾음)
+            stages: 주면 순회 중 만난 Stage 레코드도 이 목록에 추가
             
         Returns:
             {"source_tables": [...], "target_tables": [...]} 딕셔너리
@@ -810,20 +1235,30 @@ class DSXParser:
         target_tables = []
         
         try:
-            import xml.etree.ElementTree as ET
-            
             # 모든 DSRECORD 찾기
-            stage_pattern = r'BEGIN DSRECORD\s+Identifier\s+"([^"]+)"(.*?)END DSRECORD'
             total_records = 0
             tables_found = 0
+            # 레코드/테이블마다 로그 문자열을 만들지 않도록 로그 레벨은 루프 전에 한 번만 확인
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            info_enabled = logger.isEnabledFor(logging.INFO)
+            # Context로 결정된 타입별 추가 함수 (Context가 없거나 1/2가 아니면 None)
+            appenders = {"source": source_tables.append, "target": target_tables.append}
             
-            for match in re.finditer(stage_pattern, content, re.DOTALL):
+            if records is None:
+                records = _iter_dsrecords(content, start, end)
+            for identifier, record_content in records:
                 total_records += 1
-                identifier = match.group(1)
-                record_content = match.group(2)
                 
                 olet_type = self._extract_value(record_content, "OLEType")
                 stage_name = self._extract_value(record_content, "Name") or identifier
+                if stages is not None and olet_type and "Stage" in olet_type:
+                    stages.append(self._stage_record(identifier, record_content, olet_type, stage_name))
+                
+                # 테이블은 TableDef(방법 0), TableName(방법 1), XMLProperties(방법 2, 3)에서만 나오므로
+                # 셋 다 없는 레코드(대부분의 링크/컬럼 레코드)는 정규식/XML 파싱 없이 건너뜀
+                if ("XMLProperties" not in record_content and "TableName" not in record_content
+                        and "TableDef" not in record_content):
+                    continue
                 stage_type = self._extract_value(record_content, "StageType") or ""
                 
                 table_name = None
@@ -831,79 +1266,47 @@ class DSXParser:
                 table_type_determined = None  # "source" 또는 "target" 또는 None
                 
                 # 방법 0: TableDef에서 ERP 테이블 먼저 찾기 (가장 우선, XMLProperties 전)
-                tabledef_match = re.search(r'TableDef\s+"([^"]+)"', record_content)
-                if tabledef_match:
-                    tabledef_value = tabledef_match.group(1)
-                    is_erp_in_tabledef = "FILA_ERP" in tabledef_value or ("ERP" in tabledef_value.upper() and "FILA" in tabledef_value)
-                    
-                    if is_erp_in_tabledef:
-                        # 경로에서 마지막 부분 추출
-                        parts = tabledef_value.split("\\")
-                        if len(parts) >= 2:
-                            last_part = parts[-1]
-                            if "." in last_part:
-                                schema_table = last_part.split(".", 1)
-                                if len(schema_table) == 2:
-                                    temp_schema = schema_table[0]
-                                    temp_table = schema_table[1]
-                                    
-                                    # dbo는 스키마가 아니므로 제거
-                                    if temp_schema.lower() == "dbo":
-                                        # FILA_ERP.dbo.DW_ETL_L -> FILA_ERP.DW_ETL_L
-                                        for p in parts:
-                                            if "FILA_ERP" in p:
-                                                if "FILA_ERP_DW" in p:
-                                                    temp_schema = "FILA_ERP_DW"
-                                                else:
-                                                    temp_schema = "FILA_ERP"
-                                                break
-                                    
-                                    if temp_schema and temp_table:
-                                        # 파라미터 형식으로 변환하여 저장
-                                        table_name_param = f"#P_ERP_MS.$P_ERP_MS_OWN_{temp_schema}#.{temp_table}"
-                                        # ERP 테이블은 보통 소스이므로 소스로 추가
-                                        source_tables.append({
-                                            "table_name": table_name_param,
-                                            "schema": "",
-                                            "stage_name": stage_name,
-                                            "stage_type": olet_type or stage_type or "Unknown",
-                                            "table_type": "source"
-                                        })
-                                        # 다음 레코드로 이동
-                                        continue
+                erp_tabledef_table = _classify_erp_tabledef(_find_tabledef(record_content))
+                if erp_tabledef_table:
+                    # ERP 테이블은 보통 소스이므로 소스로 추가
+                    source_tables.append(TableRecord(
+                        table_name=erp_tabledef_table,
+                        schema="",
+                        stage_name=stage_name,
+                        stage_type=sys.intern(olet_type or stage_type or "Unknown"),
+                        table_type="source"
+                    ))
+                    # 다음 레코드로 이동
+                    continue
                 
                 # 방법 1: 직접 TableName 필드 찾기
                 table_name = self._extract_value(record_content, "TableName")
                 schema = self._extract_value(record_content, "SchemaName")
                 
-                logger.debug(f"[테이블 추출] Record {total_records}: identifier={identifier}, stage_name={stage_name}, "
-                           f"olet_type={olet_type}, method1_table={table_name}, method1_schema={schema}")
+                if debug_enabled:
+                    logger.debug(f"[테이블 추출] Record {total_records}: identifier={identifier}, stage_name={stage_name}, "
+                               f"olet_type={olet_type}, method1_table={table_name}, method1_schema={schema}")
                 
                 # 방법 2: XMLProperties에서 TableName 추출 및 Context 확인
                 xml_properties = self._extract_value(record_content, "XMLProperties")
                 if xml_properties:
                     # =+=+=+= 로 감싸진 경우 처리
-                    if xml_properties.startswith("=+=+=+="):
-                        xml_properties = xml_properties[7:].strip()
-                    if xml_properties.endswith("=+=+=+="):
-                        xml_properties = xml_properties[:-7].strip()
+                    xml_properties = _strip_xml_markers(xml_properties)
                     
                     try:
-                        root = ET.fromstring(xml_properties)
+                        # 트리를 만들지 않고 필요한 태그의 text만 한 번에 수집
+                        # 방법 1에서 테이블을 찾았으면 Context(와 스키마)만 필요하므로 모두 찾는 즉시 파싱 중단
+                        if table_name:
+                            scan_tags = ("Context",) if schema else ("Context", "SchemaName")
+                        else:
+                            scan_tags = _XML_PROPERTY_TAGS
+                        xml_texts = _scan_xml_properties(
+                            xml_properties, {tag: [] for tag in scan_tags}, first_only=bool(table_name)
+                        )
                         
                         # Context 확인 (source/target 구분)
-                        context_value = None
-                        # 방법 1: <Context>2</Context> 형식
-                        context_elem = root.find(".//Context")
-                        if context_elem is not None and context_elem.text:
-                            context_value = context_elem.text.strip()
-                        # 방법 2: <Context type='int'>2</Context> 형식 (속성으로도 확인)
-                        if not context_value:
-                            # 모든 Context 요소 확인
-                            for ctx_elem in root.findall(".//Context"):
-                                if ctx_elem.text:
-                                    context_value = ctx_elem.text.strip()
-                                    break
+                        # <Context>2</Context>, <Context type='int'>2</Context> 모두 text가 있는 첫 요소 사용
+                        context_value = _first_text(xml_texts["Context"])
                         
                         # Context 값에 따라 타입 결정: 1 = source, 2 = target
                         if context_value:
@@ -914,81 +1317,49 @@ class DSXParser:
                         
                         # TableName 찾기 (방법 1에서 못 찾았을 때만)
                         if not table_name:
-                            for table_elem in root.findall(".//TableName"):
-                                if table_elem.text:
-                                    table_name = table_elem.text.strip()
-                                    break
+                            table_name = _first_text(xml_texts["TableName"])
                         
                         # SchemaName 찾기 (방법 1에서 못 찾았을 때만)
                         if not schema:
-                            for schema_elem in root.findall(".//SchemaName"):
-                                if schema_elem.text:
-                                    schema = schema_elem.text.strip()
-                                    break
+                            schema = _first_text(xml_texts["SchemaName"])
                         
                         # SQL 문에서 테이블 추출 (TableName이 없는 경우)
                         if not table_name:
                             # SelectStatement 찾기
-                            for sql_elem in root.findall(".//SelectStatement"):
-                                if sql_elem.text:
-                                    sql_text = sql_elem.text.strip()
-                                    from_match = re.search(r'FROM\s+([^\s,;]+(?:\.[^\s,;]+)*)', sql_text, re.IGNORECASE | re.DOTALL)
-                                    if from_match:
-                                        table_ref = from_match.group(1).strip()
-                                        table_ref = re.sub(r'\s+', '', table_ref)
-                                        if "." in table_ref:
-                                            parts = table_ref.rsplit(".", 1)
-                                            if len(parts) == 2:
-                                                if parts[0].startswith("#"):
-                                                    table_name = table_ref
-                                                else:
-                                                    table_name = parts[1]
-                                                    schema = parts[0]
-                                        else:
-                                            table_name = table_ref
+                            for sql_text in xml_texts["SelectStatement"]:
+                                if sql_text:
+                                    from_table = _parse_from_clause(sql_text, schema)
+                                    if from_table:
+                                        table_name, schema = from_table
                                         break
                             
                             # SQL 필드도 확인
                             if not table_name:
-                                for sql_elem in root.findall(".//SQL"):
-                                    if sql_elem.text:
-                                        sql_text = sql_elem.text.strip()
-                                        from_match = re.search(r'FROM\s+([^\s,;]+(?:\.[^\s,;]+)*)', sql_text, re.IGNORECASE | re.DOTALL)
-                                        if from_match:
-                                            table_ref = from_match.group(1).strip()
-                                            table_ref = re.sub(r'\s+', '', table_ref)
-                                            if "." in table_ref:
-                                                parts = table_ref.rsplit(".", 1)
-                                                if len(parts) == 2:
-                                                    if parts[0].startswith("#"):
-                                                        table_name = table_ref
-                                                    else:
-                                                        table_name = parts[1]
-                                                        schema = parts[0]
-                                            else:
-                                                table_name = table_ref
+                                for sql_text in xml_texts["SQL"]:
+                                    if sql_text:
+                                        from_table = _parse_from_clause(sql_text, schema)
+                                        if from_table:
+                                            table_name, schema = from_table
                                             break
-                                if table_name:
-                                    break
                     
                     except (ET.ParseError, UnicodeDecodeError) as e:
                         logger.debug(f"XML 파싱 실패: {e}")
                         # XML 파싱 실패 시 정규식으로 시도
                         if not table_name:
-                            table_match = re.search(r'<TableName[^>]*><!\[CDATA\[(.*?)\]\]></TableName>', xml_properties, re.DOTALL)
-                            if table_match:
-                                table_name = table_match.group(1).strip()
+                            table_cdata = _extract_cdata(xml_properties, "TableName")
+                            if table_cdata is not None:
+                                table_name = table_cdata.strip()
                             
                             if not schema:
-                                schema_match = re.search(r'<SchemaName[^>]*><!\[CDATA\[(.*?)\]\]></SchemaName>', xml_properties, re.DOTALL)
-                                if schema_match:
-                                    schema = schema_match.group(1).strip()
+                                schema_cdata = _extract_cdata(xml_properties, "SchemaName")
+                                if schema_cdata is not None:
+                                    schema = schema_cdata.strip()
                             
                             # Context도 정규식으로 찾기
                             if not table_type_determined:
-                                context_match = re.search(r'<Context[^>]*><!\[CDATA\[(.*?)\]\]></Context>', xml_properties, re.DOTALL)
-                                if context_match:
-                                    context_value = context_match.group(1).strip()
+                                context_cdata = _extract_cdata(xml_properties, "Context")
+                                if context_cdata is not None:
+                                    context_value = context_cdata.strip()
                                     if context_value == "1":
                                         table_type_determined = "source"
                                     elif context_value == "2":
@@ -996,114 +1367,85 @@ class DSXParser:
                             
                             # SQL 문에서 테이블 추출
                             if not table_name:
-                                select_match = re.search(r'<SelectStatement[^>]*><!\[CDATA\[(.*?)\]\]></SelectStatement>', xml_properties, re.DOTALL)
-                                if select_match:
-                                    sql_text = select_match.group(1).strip()
-                                    from_match = re.search(r'FROM\s+([^\s,;]+(?:\.[^\s,;]+)*)', sql_text, re.IGNORECASE | re.DOTALL)
-                                    if from_match:
-                                        table_ref = from_match.group(1).strip()
-                                        table_ref = re.sub(r'\s+', '', table_ref)
-                                        if "." in table_ref:
-                                            parts = table_ref.rsplit(".", 1)
-                                            if len(parts) == 2:
-                                                if parts[0].startswith("#"):
-                                                    table_name = table_ref
-                                                else:
-                                                    table_name = parts[1]
-                                                    schema = parts[0]
-                                        else:
-                                            table_name = table_ref
+                                select_cdata = _extract_cdata(xml_properties, "SelectStatement")
+                                if select_cdata is not None:
+                                    from_table = _parse_from_clause(select_cdata, schema)
+                                    if from_table:
+                                        table_name, schema = from_table
                                 
                                 if not table_name:
-                                    sql_match = re.search(r'<SQL[^>]*><!\[CDATA\[(.*?)\]\]></SQL>', xml_properties, re.DOTALL)
-                                    if sql_match:
-                                        sql_text = sql_match.group(1).strip()
-                                        from_match = re.search(r'FROM\s+([^\s,;]+(?:\.[^\s,;]+)*)', sql_text, re.IGNORECASE | re.DOTALL)
-                                        if from_match:
-                                            table_ref = from_match.group(1).strip()
-                                            table_ref = re.sub(r'\s+', '', table_ref)
-                                            if "." in table_ref:
-                                                parts = table_ref.rsplit(".", 1)
-                                                if len(parts) == 2:
-                                                    if parts[0].startswith("#"):
-                                                        table_name = table_ref
-                                                    else:
-                                                        table_name = parts[1]
-                                                        schema = parts[0]
-                                            else:
-                                                table_name = table_ref
+                                    sql_cdata = _extract_cdata(xml_properties, "SQL")
+                                    if sql_cdata is not None:
+                                        from_table = _parse_from_clause(sql_cdata, schema)
+                                        if from_table:
+                                            table_name, schema = from_table
                 
-                # 방법 3: 정규식으로 직접 찾기
+                # 방법 3: XMLProperties 블록을 직접 잘라 찾기
                 if not table_name:
-                    xml_properties_match = re.search(r'XMLProperties.*?Value\s+(?:=+=+=+=)?(.*?)(?:=+=+=+=)?\s+END DSSUBRECORD', record_content, re.DOTALL)
-                    if xml_properties_match:
-                        xml_content = xml_properties_match.group(1)
-                        table_match = re.search(r'<TableName[^>]*><!\[CDATA\[(.*?)\]\]></TableName>', xml_content, re.DOTALL)
-                        if table_match:
-                            table_name = table_match.group(1).strip()
+                    xml_content = _find_xmlprops_block(record_content)
+                    if xml_content is not None:
+                        table_cdata = _extract_cdata(xml_content, "TableName")
+                        if table_cdata is not None:
+                            table_name = table_cdata.strip()
                 
                 # 테이블명에서 스키마와 테이블명 분리
                 if table_name:
-                    original_table_name = table_name
-                    if "." in table_name and not schema:
-                        parts = table_name.rsplit(".", 1)
-                        if len(parts) == 2:
-                            potential_schema = parts[0]
-                            potential_table = parts[1]
-                            if not potential_schema.startswith("#") and potential_table:
-                                schema = potential_schema
-                                table_name = potential_table
+                    if not schema:
+                        # 마지막 '.' 뒤에 테이블명이 남는 경우만 분리 (파라미터 스키마 '#...'는 그대로 둠)
+                        dot = table_name.rfind(".")
+                        if 0 <= dot < len(table_name) - 1 and not table_name.startswith("#"):
+                            schema = table_name[:dot]
+                            table_name = table_name[dot + 1:]
                     
                     if table_name.endswith("#.") or table_name == "#":
                         continue
                     
                     if table_name and table_name.strip():
                         tables_found += 1
-                        table_info = {
-                            "table_name": table_name,
-                            "schema": schema or "",
-                            "stage_name": stage_name,
-                            "stage_type": olet_type or stage_type or "Unknown",
-                            "table_type": table_type_determined or "unknown"
-                        }
+                        table_info = TableRecord(
+                            table_name=table_name,
+                            schema=sys.intern(schema or ""),
+                            stage_name=stage_name,
+                            stage_type=sys.intern(olet_type or stage_type or "Unknown"),
+                            table_type=table_type_determined or "unknown"
+                        )
                         
-                        full_name = f"{schema}.{table_name}" if schema else table_name
-                        logger.info(f"[테이블 추출 성공] {tables_found}번째: full_name={full_name}, "
-                                  f"stage_name={stage_name}, context={table_type_determined}")
+                        if info_enabled:
+                            full_name = f"{schema}.{table_name}" if schema else table_name
+                            logger.info(f"[테이블 추출 성공] {tables_found}번째: full_name={full_name}, "
+                                      f"stage_name={stage_name}, context={table_type_determined}")
                         
                         # Context 값에 따라 source/target 분류
                         # Context가 명확하지 않으면 Stage 타입으로 판단 시도
-                        if table_type_determined == "source":
-                            source_tables.append(table_info)
-                            logger.debug(f"  → source_tables에 추가")
-                        elif table_type_determined == "target":
-                            target_tables.append(table_info)
-                            logger.debug(f"  → target_tables에 추가")
+                        append_table = appenders.get(table_type_determined)
+                        if append_table is not None:
+                            append_table(table_info)
+                            if debug_enabled:
+                                logger.debug(f"  → {table_type_determined}_tables에 추가")
                         else:
                             # Context가 없을 때는 Stage 타입으로 판단
                             # 일반적으로 Database/ODBC Stage는 Context가 있어야 하지만,
                             # 없는 경우 Stage 이름이나 타입으로 추정
                             # 중복 방지를 위해 한쪽에만 추가 (일단 타겟으로 간주)
                             # (실제로는 Context가 있는 경우가 대부분이므로 이 경우는 드뭄)
-                            stage_type_lower = (olet_type or stage_type or "").lower()
-                            stage_name_lower = (stage_name or "").lower()
-                            
                             # Stage 이름에 "source", "input", "read" 등이 있으면 소스로 간주
-                            if any(keyword in stage_name_lower for keyword in ["source", "input", "read", "from"]):
+                            # "target", "output", "write", "to" 등만 있으면 타겟으로 간주
+                            # (소문자 변환은 이 경우에만 필요하므로 여기서 계산)
+                            stage_class = _classify_stage_name(stage_name.lower())
+                            if stage_class == "source":
                                 source_tables.append(table_info)
-                                logger.debug(f"  → source_tables에 추가 (Stage 이름으로 판단)")
-                            # Stage 이름에 "target", "output", "write", "to" 등이 있으면 타겟으로 간주
-                            elif any(keyword in stage_name_lower for keyword in ["target", "output", "write", "to", "_t_", "_tgt"]):
+                                logger.debug("  → source_tables에 추가 (Stage 이름으로 판단)")
+                            elif stage_class == "target":
                                 target_tables.append(table_info)
-                                logger.debug(f"  → target_tables에 추가 (Stage 이름으로 판단)")
+                                logger.debug("  → target_tables에 추가 (Stage 이름으로 판단)")
                             else:
                                 # 판단 불가능한 경우는 추가하지 않음 (중복 방지)
-                                logger.debug(f"  → Context 없음, Stage 이름으로도 판단 불가, 추가하지 않음")
+                                logger.debug("  → Context 없음, Stage 이름으로도 판단 불가, 추가하지 않음")
                 
         except Exception as e:
             logger.error(f"테이블 추출 중 오류: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(traceback.format_exc())
         
         logger.info(f"[테이블 추출 완료] 총 {total_records}개 레코드 스캔, {tables_found}개 테이블 발견, "
                    f"source={len(source_tables)}개, target={len(target_tables)}개")
@@ -1131,71 +1473,131 @@ class DSXParser:
                 logger.warning(f"디렉토리가 존재하지 않습니다: {directory}")
                 return jobs
             
-            # 패턴이 "*"이면 모든 파일 시도
-            if pattern == "*":
-                files_to_check = list(dir_path.iterdir())
-            else:
-                files_to_check = list(dir_path.glob(pattern))
-            
             # 확장자 없는 파일도 포함 (DSX 형식인지 확인)
-            if pattern == "*.dsx" or pattern == "*":
-                # 확장자 없는 파일도 추가
-                for file_path in dir_path.iterdir():
-                    if file_path.is_file() and not file_path.suffix and file_path not in files_to_check:
-                        files_to_check.append(file_path)
+            include_no_suffix = pattern == "*.dsx" or pattern == "*"
             
+            if os.sep in pattern or "/" in pattern or "**" in pattern:
+                # 하위 경로를 포함하는 패턴은 glob으로 처리
+                files_to_check = [file_path for file_path in dir_path.glob(pattern) if file_path.is_file()]
+                no_suffix_files = []
+            else:
+                # 디렉토리를 한 번만 읽고 DirEntry의 캐시된 파일 종류로 판단 (파일마다 stat 호출 없음)
+                # 패턴 일치 파일을 먼저, 확장자 없는 파일을 뒤에 두는 순서는 그대로 유지
+                files_to_check = []
+                no_suffix_files = []
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if not entry.is_file():
+                            continue
+                        if pattern == "*" or fnmatch.fnmatch(entry.name, pattern):
+                            files_to_check.append(Path(entry.path))
+                        elif include_no_suffix:
+                            file_path = Path(entry.path)
+                            if not file_path.suffix:
+                                no_suffix_files.append(file_path)
+            files_to_check.extend(no_suffix_files)
+            
+            # 수정 시각과 크기가 같은 파일은 캐시된 결과를 쓰고 읽지 않음
+            # (캐시된 목록은 여기서 잡아 두므로 이후 새 결과가 캐시에서 밀어내도 영향 없음)
+            file_entries = []
             for dsx_file in files_to_check:
                 try:
-                    # 파일이 DSX 형식인지 확인 (HEADER 섹션 확인)
-                    if dsx_file.is_file():
-                        try:
-                            with open(dsx_file, 'r', encoding='utf-8', errors='ignore') as f:
-                                first_lines = ''.join(f.readlines()[:5])
-                                if 'BEGIN HEADER' not in first_lines and 'BEGIN DSJOB' not in first_lines:
-                                    continue  # DSX 형식이 아님
-                        except:
-                            continue
-                    
-                    # 여러 Job이 포함된 경우를 처리
-                    with open(dsx_file, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    # 여러 Job 파싱 시도
-                    parsed_jobs = self.parse_multiple_jobs(content, str(dsx_file))
-                    
-                    if parsed_jobs:
-                        # 여러 Job이 파싱된 경우
-                        for job_info in parsed_jobs:
-                            if job_info and job_info.get("name"):
-                                jobs.append({
-                                    "name": job_info["name"],
-                                    "identifier": job_info.get("identifier"),
-                                    "description": job_info.get("description"),
-                                    "category": job_info.get("category"),
-                                    "project": job_info.get("project"),
-                                    "file_path": str(dsx_file),
-                                    "source": "local_dsx"
-                                })
-                    else:
-                        # 단일 Job으로 파싱 시도
-                        job_info = self.parse_dsx_file(str(dsx_file))
-                        if job_info and job_info.get("name"):
-                            jobs.append({
-                                "name": job_info["name"],
-                                "identifier": job_info.get("identifier"),
-                                "description": job_info.get("description"),
-                                "category": job_info.get("category"),
-                                "project": job_info.get("project"),
-                                "file_path": str(dsx_file),
-                                "source": "local_dsx"
-                            })
-                except Exception as e:
-                    logger.debug(f"DSX 파일 파싱 실패: {dsx_file} - {e}")
+                    stat = dsx_file.stat()
+                    cache_key = (str(dsx_file), stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    file_entries.append((dsx_file, None, None))
                     continue
+                cached_jobs = _scan_cache.get(cache_key)
+                if cached_jobs is not None:
+                    _scan_cache.move_to_end(cache_key)
+                file_entries.append((dsx_file, cache_key, cached_jobs))
+            
+            # 캐시에 없는 파일은 스레드로 미리 읽으며 순서대로 파싱
+            uncached_files = [dsx_file for dsx_file, _, cached_jobs in file_entries if cached_jobs is None]
+            parsed_iter = iter(self._scan_files_threaded(uncached_files))
+            for dsx_file, cache_key, file_jobs in file_entries:
+                if file_jobs is None:
+                    file_jobs = next(parsed_iter)
+                    if cache_key is not None:
+                        _scan_cache[cache_key] = file_jobs
+                        if len(_scan_cache) > _SCAN_CACHE_SIZE:
+                            _scan_cache.popitem(last=False)
+                # 호출자가 결과를 수정해도 캐시가 오염되지 않도록 복사본 반환
+                jobs.extend(dict(job) for job in file_jobs)
             
             logger.info(f"로컬 DSX 파일에서 {len(jobs)}개 Job 발견: {directory}")
         except Exception as e:
             logger.error(f"디렉토리 스캔 실패: {directory} - {e}")
         
         return jobs
+    
+    def _scan_files_threaded(self, dsx_files: List[Path]) -> Iterator[List[Dict[str, Any]]]:
+        """
+        파일 읽기는 스레드 풀에서 미리 진행하고, 파싱은 파일 순서대로 처리해 Job 요약 목록을 차례로 반환
+        
+        읽기 대기 시간을 파싱과 겹치되, 미리 읽어 두는 파일 수는 _SCAN_READ_AHEAD개로 제한합니다.
+        """
+        with ThreadPoolExecutor(max_workers=_SCAN_READ_THREADS) as executor:
+            pending = deque()
+            file_iter = iter(dsx_files)
+            for dsx_file in file_iter:
+                pending.append((dsx_file, executor.submit(_load_dsx_candidate, dsx_file)))
+                if len(pending) >= _SCAN_READ_AHEAD:
+                    break
+            
+            while pending:
+                dsx_file, future = pending.popleft()
+                next_file = next(file_iter, None)
+                if next_file is not None:
+                    pending.append((next_file, executor.submit(_load_dsx_candidate, next_file)))
+                yield self._scan_dsx_file(dsx_file, future.result)
+    
+    @staticmethod
+    def _normalize_job(job_info: Dict[str, Any], file_path: str) -> Dict[str, Any]:
+        """파싱된 Job 정보를 scan_directory 결과 형식(요약 딕셔너리)으로 변환"""
+        return {
+            "name": job_info["name"],
+            "identifier": job_info.get("identifier"),
+            "description": job_info.get("description"),
+            "category": job_info.get("category"),
+            "project": job_info.get("project"),
+            "file_path": file_path,
+            "source": "local_dsx"
+        }
+    
+    def _scan_dsx_file(self, dsx_file: Path, load: Callable[[], Optional[str]]) -> List[Dict[str, Any]]:
+        """
+        scan_directory에서 읽은 파일 하나를 파싱해 Job 요약 목록 반환
+        
+        Args:
+            dsx_file: 파일 경로
+            load: 파일 내용을 돌려주는 함수 (_load_dsx_candidate 결과, DSX 형식이 아니면 None)
+        
+        Returns:
+            Job 요약 딕셔너리 리스트 (실패하거나 DSX 형식이 아니면 빈 리스트)
+        """
+        jobs = []
+        try:
+            # 여러 Job이 포함된 경우를 처리
+            content = load()
+            if content is None:
+                return jobs  # DSX 형식이 아님
+            
+            # 여러 Job 파싱 시도
+            parsed_jobs = self.parse_multiple_jobs(content, str(dsx_file))
+            
+            if not parsed_jobs:
+                # 단일 Job으로 파싱 시도
+                parsed_jobs = [self.parse_dsx_file(str(dsx_file))]
+            
+            file_path = str(dsx_file)
+            for job_info in parsed_jobs:
+                if job_info and job_info.get("name"):
+                    jobs.append(self._normalize_job(job_info, file_path))
+        except Exception as e:
+            # 파일 하나가 실패해도 디렉토리 스캔 전체가 중단되지 않도록 기록 후 건너뜀
+            # (프로세스 풀 워커도 이 함수를 거치므로 예외가 executor.map 전체를 중단시키지 않음)
+            logger.debug(f"DSX 파일 파싱 실패: {dsx_file} - {e}")
+        
+        return jobs
 
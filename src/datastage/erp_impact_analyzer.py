@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import json
 import csv
+import functools
+import json
+import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import AbstractSet, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from src.core.config import get_config
 from src.core.logger import get_logger
@@ -11,6 +14,13 @@ from src.core.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Stage 타입(소문자)에 포함된 키워드로 역할 판단 (키워드별 in 검사를 한 번의 검색으로)
+_RE_SOURCE_STAGE_TYPE = re.compile(r"input|source|read")
+_RE_TARGET_STAGE_TYPE = re.compile(r"output|target|write")
+# Stage 이름(대문자) 접두사로 역할 판단
+_SOURCE_STAGE_PREFIXES = ("S_", "L_", "SRC", "READ")
+_TARGET_STAGE_PREFIXES = ("T_", "W_", "TRG", "TGT")
+
 
 class ERPImpactAnalyzer:
     """
@@ -28,22 +38,33 @@ class ERPImpactAnalyzer:
     ) -> None:
         self.dependency_analyzer = dependency_analyzer
         self.export_directory = Path(export_directory) if export_directory else dependency_analyzer.export_directory
-        self.erp_tables: Set[str] = set()
-        self.erp_tables_simple: Set[str] = set()
+        # ERP 테이블 집합은 로드 후 바뀌지 않으므로 frozenset으로 두고, 이름은 intern해 같은 객체를 공유
+        self.erp_tables: FrozenSet[str] = frozenset()
+        self.erp_tables_simple: FrozenSet[str] = frozenset()
         self.erp_column_map: Dict[str, Set[str]] = {}
         if erp_tables:
-            normalized_tables = {self._normalize_table_name(t) for t in erp_tables}
+            normalized_tables = frozenset(sys.intern(self._normalize_table_name(t)) for t in erp_tables)
             self.erp_tables = normalized_tables
-            self.erp_tables_simple = {self._strip_schema(t) for t in normalized_tables}
+            self.erp_tables_simple = frozenset(self._strip_schema(t) for t in normalized_tables)
 
         config = get_config()
         impact_cfg = config.get("erp_impact", {})
         self.od_schemas = {s.upper() for s in impact_cfg.get("od_schemas", [])}
         self.ft_schemas = {s.upper() for s in impact_cfg.get("ft_schemas", [])}
-        self.od_prefixes = [p.upper() for p in impact_cfg.get("od_prefixes", [])]
-        self.ft_prefixes = [p.upper() for p in impact_cfg.get("ft_prefixes", [])]
+        # str.startswith에 튜플로 넘겨 접두사 비교를 한 번의 호출로 처리
+        self.od_prefixes = tuple(p.upper() for p in impact_cfg.get("od_prefixes", []))
+        self.ft_prefixes = tuple(p.upper() for p in impact_cfg.get("ft_prefixes", []))
 
         self._job_metadata_cache: Optional[Dict[str, Dict[str, any]]] = None
+        # DSX 파일 경로 -> 해당 파일의 Job 메타데이터 (1차 연관 분석용, 파일 단위 지연 로드)
+        self._file_metadata_cache: Dict[str, Dict[str, Dict[str, any]]] = {}
+        # 테이블명 -> 분류 결과 (ERP 테이블 목록이 바뀌면 초기화)
+        self._classify_cache: Dict[str, str] = {}
+        # OD 소스 테이블 -> 그 테이블을 읽는 Job 이름 목록 (메타데이터 순서, 2차 연관 후보 탐색용)
+        self._od_source_index: Optional[Dict[str, List[str]]] = None
+        # (파일 경로, Job 이름) -> 분류된 소스/타겟 테이블 집합 (컬럼과 무관하므로 분석 간에 재사용)
+        # 여러 파일에 같은 이름의 Job이 있을 수 있으므로 파일 경로까지 키로 사용
+        self._job_tables_cache: Dict[Tuple[Optional[str], str], Dict[str, FrozenSet[str]]] = {}
 
     # ------------------------------------------------------------------ ERP 테이블 로드
     def load_erp_tables_from_file(self, file_path: str) -> None:
@@ -55,28 +76,34 @@ class ERPImpactAnalyzer:
         tables: Set[str] = set()
         column_map: Dict[str, Set[str]] = {}
 
-        with open(path, "r", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            for row in reader:
+        # 행이 많은 ERP 카탈로그를 위해 큰 버퍼로 읽고, 루프 안의 속성 조회는 지역 변수로 줄임
+        # (newline=""은 csv 모듈 권장 방식으로, 따옴표 안의 줄바꿈도 그대로 읽힘)
+        normalize = self._normalize_table_name
+        add_table = tables.add
+        map_column = column_map.setdefault
+        with open(path, "r", encoding="utf-8", newline="", buffering=1 << 20) as f:
+            for row in csv.reader(f):
                 if not row:
                     continue
                 table_entry = row[0].strip()
                 if not table_entry or table_entry.startswith("#"):
                     continue
-                normalized_table = self._normalize_table_name(table_entry)
-                tables.add(normalized_table)
+                normalized_table = sys.intern(normalize(table_entry))
+                add_table(normalized_table)
 
                 if len(row) > 1:
                     column_name = row[1].strip()
                     if column_name:
-                        column_upper = column_name.upper()
-                        column_map.setdefault(column_upper, set()).add(normalized_table)
+                        map_column(column_name.upper(), set()).add(normalized_table)
 
         if not tables:
             logger.warning("ERP 테이블 리스트가 비어 있습니다.")
-        self.erp_tables = tables
-        self.erp_tables_simple = {self._strip_schema(t) for t in tables}
+        self.erp_tables = frozenset(tables)
+        self.erp_tables_simple = frozenset(self._strip_schema(t) for t in tables)
         self.erp_column_map = column_map
+        self._classify_cache.clear()
+        self._od_source_index = None
+        self._job_tables_cache.clear()
         logger.info(f"ERP 테이블 {len(self.erp_tables)}개 로드 완료.")
         if self.erp_column_map:
             logger.info(f"ERP 컬럼-테이블 매핑 {len(self.erp_column_map)}개 컬럼 로드.")
@@ -120,22 +147,30 @@ class ERPImpactAnalyzer:
                 len(allowed_erp_tables),
             )
 
-        allowed_full = set(allowed_erp_tables)
-        allowed_simple = {self._strip_schema(t) for t in allowed_full}
+        if allowed_erp_tables is self.erp_tables:
+            # 전체 ERP 테이블을 쓰는 경우 스키마 제외 이름 집합은 이미 만들어 둔 것을 사용
+            allowed_full = self.erp_tables
+            allowed_simple = self.erp_tables_simple
+        else:
+            allowed_full = frozenset(allowed_erp_tables)
+            allowed_simple = frozenset(self._strip_schema(t) for t in allowed_full)
         allowed_tuple = (allowed_full, allowed_simple)
 
         jobs_with_column = self.dependency_analyzer.find_jobs_using_column_only(
             column_name=column_name,
             export_directory=str(self.export_directory),
         )
-        job_meta = self._get_job_metadata()
-
+        if max_level >= 2:
+            # 2차 연관에는 전체 Job 메타데이터가 필요하므로 먼저 로드 (파일별 메타데이터도 함께 채워져
+            # 1차 연관에서 같은 파일을 다시 분석하지 않음). 1차만 분석할 때는 컬럼을 사용하는 Job의 파일만 분석
+            self._get_job_metadata()
         tier1_jobs, tier1_od_targets, impacted_erp_tables = self._find_tier1_jobs(
             jobs_with_column,
-            job_meta,
             allowed_tuple,
         )
-        tier2_jobs = self._find_tier2_jobs(job_meta, tier1_od_targets, max_level)
+        tier2_jobs: List[Dict[str, any]] = []
+        if tier1_od_targets and max_level >= 2:
+            tier2_jobs = self._find_tier2_jobs(self._get_job_metadata(), tier1_od_targets, max_level)
 
         result = {
             "column": column_name,
@@ -161,8 +196,7 @@ class ERPImpactAnalyzer:
     def _find_tier1_jobs(
         self,
         jobs_with_column: List[Dict[str, any]],
-        job_meta: Dict[str, Dict[str, any]],
-        allowed_erp_tables: Optional[Tuple[Set[str], Set[str]]],
+        allowed_erp_tables: Optional[Tuple[AbstractSet[str], AbstractSet[str]]],
     ) -> Tuple[List[Dict[str, any]], Set[str], Set[str]]:
         tier1_jobs: List[Dict[str, any]] = []
         tier1_od_targets: Set[str] = set()
@@ -170,19 +204,13 @@ class ERPImpactAnalyzer:
 
         for job_entry in jobs_with_column:
             job_name = job_entry.get("job_name")
-            metadata = job_meta.get(job_name)
+            metadata = self._get_entry_metadata(job_entry)
             if not metadata:
                 continue
 
-            source_entries = self._get_tables_by_role(metadata, "source")
-            target_entries = self._get_tables_by_role(metadata, "target")
-
-            erp_sources = self._collect_tables(
-                source_entries,
-                desired_type="erp",
-                allowed_tables=allowed_erp_tables,
-            )
-            od_targets = self._collect_tables(target_entries, desired_type="od")
+            job_tables = self._get_job_tables(job_name, metadata)
+            erp_sources = self._filter_allowed(job_tables["erp_sources"], allowed_erp_tables)
+            od_targets = job_tables["od_targets"]
             if not erp_sources:
                 erp_sources = self._collect_from_table_names(
                     job_entry.get("all_tables", []),
@@ -221,15 +249,20 @@ class ERPImpactAnalyzer:
         tier2_jobs: List[Dict[str, any]] = []
         tier1_od_set = {t.upper() for t in tier1_od_targets}
 
-        for metadata in job_meta.values():
+        # 1차 OD 테이블을 소스로 읽는 Job만 후보로 두고, 결과 순서는 메타데이터 순서를 유지
+        od_source_index = self._get_od_source_index(job_meta)
+        candidate_names = {name for table in tier1_od_set for name in od_source_index.get(table, ())}
+        job_order = {name: i for i, name in enumerate(job_meta)} if candidate_names else {}
+
+        for candidate_name in sorted(candidate_names, key=job_order.__getitem__):
+            metadata = job_meta[candidate_name]
             job_name = metadata.get("job_name")
-            source_entries = self._get_tables_by_role(metadata, "source")
-            target_entries = self._get_tables_by_role(metadata, "target")
+            job_tables = self._get_job_tables(candidate_name, metadata)
 
-            od_sources = self._collect_tables(source_entries, desired_type="od")
+            od_sources = job_tables["od_sources"]
             if not od_sources or not (od_sources & tier1_od_set):
                 continue
-            ft_targets = self._collect_tables(target_entries, desired_type="ft")
+            ft_targets = job_tables["ft_targets"]
             if not ft_targets:
                 continue
 
@@ -244,11 +277,59 @@ class ERPImpactAnalyzer:
 
         return tier2_jobs
 
+    def _get_od_source_index(self, job_meta: Dict[str, Dict[str, any]]) -> Dict[str, List[str]]:
+        """OD 소스 테이블 -> Job 이름 목록 역색인 (한 번 만들어 분석 간에 재사용)"""
+        if self._od_source_index is not None:
+            return self._od_source_index
+
+        index: Dict[str, List[str]] = {}
+        for job_name, metadata in job_meta.items():
+            for table in self._get_job_tables(job_name, metadata)["od_sources"]:
+                index.setdefault(table, []).append(job_name)
+        self._od_source_index = index
+        return index
+
+    def _get_job_tables(self, job_name: str, metadata: Dict[str, any]) -> Dict[str, FrozenSet[str]]:
+        """
+        Job의 소스/타겟 테이블을 분류한 집합 (erp_sources, od_sources, od_targets, ft_targets)
+
+        Job 메타데이터는 분석 중에 바뀌지 않으므로 (파일 경로, Job 이름)마다 한 번만 분류합니다.
+        erp_sources는 컬럼별 ERP 테이블 제한을 적용하기 전 집합입니다.
+        """
+        cache_key = (metadata.get("file_path"), job_name)
+        job_tables = self._job_tables_cache.get(cache_key)
+        if job_tables is None:
+            source_entries = self._get_tables_by_role(metadata, "source")
+            target_entries = self._get_tables_by_role(metadata, "target")
+            job_tables = {
+                "erp_sources": frozenset(self._collect_tables(source_entries, desired_type="erp")),
+                "od_sources": frozenset(self._collect_tables(source_entries, desired_type="od")),
+                "od_targets": frozenset(self._collect_tables(target_entries, desired_type="od")),
+                "ft_targets": frozenset(self._collect_tables(target_entries, desired_type="ft")),
+            }
+            self._job_tables_cache[cache_key] = job_tables
+        return job_tables
+
+    def _filter_allowed(
+        self,
+        erp_tables: AbstractSet[str],
+        allowed_tables: Optional[Tuple[AbstractSet[str], AbstractSet[str]]],
+    ) -> Set[str]:
+        """정규화된 ERP 테이블 중 허용 목록(전체 이름 또는 스키마 제외 이름)에 있는 것만 반환"""
+        if allowed_tables is None:
+            return set(erp_tables)
+        allowed_full, allowed_simple = allowed_tables
+        return {
+            table
+            for table in erp_tables
+            if table in allowed_full or self._strip_schema(table) in allowed_simple
+        }
+
     def _collect_tables(
         self,
         table_list: List[Dict[str, any]],
         desired_type: str,
-        allowed_tables: Optional[Tuple[Set[str], Set[str]]] = None,
+        allowed_tables: Optional[Tuple[AbstractSet[str], AbstractSet[str]]] = None,
     ) -> Set[str]:
         collected: Set[str] = set()
         for table in table_list:
@@ -257,22 +338,16 @@ class ERPImpactAnalyzer:
                 continue
             table_type = self._classify_table(full_name)
             if table_type == desired_type:
-                normalized = self._normalize_table_name(full_name)
-                if desired_type == "erp" and allowed_tables is not None:
-                    allowed_full, allowed_simple = allowed_tables
-                    if (
-                        normalized not in allowed_full
-                        and self._strip_schema(normalized) not in allowed_simple
-                    ):
-                        continue
-                collected.add(normalized)
+                collected.add(self._normalize_table_name(full_name))
+        if desired_type == "erp" and allowed_tables is not None:
+            return self._filter_allowed(collected, allowed_tables)
         return collected
 
     def _collect_from_table_names(
         self,
         table_names: List[str],
         desired_type: str,
-        allowed_tables: Optional[Tuple[Set[str], Set[str]]] = None,
+        allowed_tables: Optional[Tuple[AbstractSet[str], AbstractSet[str]]] = None,
     ) -> Set[str]:
         if not table_names:
             return set()
@@ -280,6 +355,13 @@ class ERPImpactAnalyzer:
         return self._collect_tables(pseudo_entries, desired_type, allowed_tables)
 
     def _classify_table(self, full_name: str) -> str:
+        # 같은 테이블이 여러 Job/분석에 반복해서 나오므로 분류 결과를 캐시
+        table_type = self._classify_cache.get(full_name)
+        if table_type is None:
+            table_type = self._classify_cache[full_name] = self._classify_table_uncached(full_name)
+        return table_type
+
+    def _classify_table_uncached(self, full_name: str) -> str:
         normalized = self._normalize_table_name(full_name)
         if normalized in self.erp_tables or self._strip_schema(normalized) in self.erp_tables_simple:
             return "erp"
@@ -292,9 +374,9 @@ class ERPImpactAnalyzer:
         return "other"
 
     @staticmethod
-    def _matches(schema: str, table: str, schema_set: Set[str], prefixes: List[str]) -> bool:
+    def _matches(schema: str, table: str, schema_set: Set[str], prefixes: Tuple[str, ...]) -> bool:
         schema_match = schema in schema_set if schema_set else False
-        prefix_match = any(table.startswith(prefix) for prefix in prefixes)
+        prefix_match = table.startswith(prefixes)
         return schema_match or prefix_match
 
     def _get_tables_by_role(self, metadata: Dict[str, any], role: str) -> List[Dict[str, any]]:
@@ -318,19 +400,45 @@ class ERPImpactAnalyzer:
             return table_type
 
         stage_type = (table.get("stage_type") or "").lower()
-        if any(keyword in stage_type for keyword in ("input", "source", "read")):
+        if _RE_SOURCE_STAGE_TYPE.search(stage_type):
             return "source"
-        if any(keyword in stage_type for keyword in ("output", "target", "write")):
+        if _RE_TARGET_STAGE_TYPE.search(stage_type):
             return "target"
 
         stage_name = (table.get("stage_name") or "").upper()
-        if stage_name.startswith(("S_", "L_", "SRC", "READ")):
+        if stage_name.startswith(_SOURCE_STAGE_PREFIXES):
             return "source"
-        if stage_name.startswith(("T_", "W_", "TRG", "TGT")):
+        if stage_name.startswith(_TARGET_STAGE_PREFIXES):
             return "target"
 
         return "unknown"
 
+    def _get_entry_metadata(self, job_entry: Dict[str, any]) -> Optional[Dict[str, any]]:
+        """
+        컬럼을 사용하는 Job 항목의 메타데이터
+
+        파일 경로를 알면 그 파일의 Job을 사용하고 (같은 이름의 Job이 다른 파일에 있어도 구분),
+        모르면 전체 메타데이터에서 Job 이름으로 찾습니다.
+        """
+        job_name = job_entry.get("job_name")
+        if not job_name:
+            return None
+        file_path = job_entry.get("file_path")
+        if not file_path:
+            return self._get_job_metadata().get(job_name)
+        return self._get_file_metadata(file_path).get(job_name)
+
+    def _get_file_metadata(self, file_path: str) -> Dict[str, Dict[str, any]]:
+        file_metadata = self._file_metadata_cache.get(file_path)
+        if file_metadata is None:
+            file_metadata = {}
+            for job in self.dependency_analyzer.analyze_file_dependencies(file_path):
+                job_name = job.get("job_name")
+                if job_name:
+                    file_metadata[job_name] = job
+            self._file_metadata_cache[file_path] = file_metadata
+        return file_metadata
+
     def _get_job_metadata(self) -> Dict[str, Dict[str, any]]:
         if self._job_metadata_cache is not None:
             return self._job_metadata_cache
@@ -338,12 +446,19 @@ class ERPImpactAnalyzer:
         dependencies = self.dependency_analyzer.analyze_all_dependencies(str(self.export_directory))
         jobs = dependencies.get("jobs", [])
         metadata = {}
+        file_metadata: Dict[str, Dict[str, Dict[str, any]]] = {}
         for job in jobs:
             job_name = job.get("job_name")
             if not job_name:
                 continue
             metadata[job_name] = job
+            file_path = job.get("file_path")
+            if file_path:
+                file_metadata.setdefault(file_path, {})[job_name] = job
         self._job_metadata_cache = metadata
+        # 전체 분석 결과로 파일별 메타데이터도 채워 1차 연관 분석에서 파일을 다시 분석하지 않음
+        for file_path, jobs_in_file in file_metadata.items():
+            self._file_metadata_cache.setdefault(file_path, jobs_in_file)
         logger.info(f"Job 메타데이터 {len(metadata)}개 로드")
         return metadata
 
@@ -364,6 +479,7 @@ class ERPImpactAnalyzer:
         return "", full_name
 
     @staticmethod
+    @functools.lru_cache(maxsize=8192)
     def _normalize_table_name(full_name: str) -> str:
         normalized = full_name.strip().upper()
         if "." not in normalized:
@@ -379,10 +495,4 @@ class ERPImpactAnalyzer:
             return full_name.split(".", 1)[1]
         return full_name
 
-    @staticmethod
-    def _strip_schema(full_name: str) -> str:
-        if "." in full_name:
-            return full_name.split(".", 1)[1]
-        return full_name
-
 
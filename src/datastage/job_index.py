@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Set
 from datetime import datetime
 from collections import defaultdict
+from itertools import islice
 
 from src.core.logger import get_logger
 
@@ -358,7 +359,7 @@ class JobIndex:
                 
                 # 파일 읽기
                 with open(dsx_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    first_lines = ''.join(f.readlines()[:5])
+                    first_lines = ''.join(islice(f, 5))  # 앞 5줄만 읽음 (파일 전체를 읽지 않음)
                     if 'BEGIN HEADER' not in first_lines and 'BEGIN DSJOB' not in first_lines:
                         continue
                 
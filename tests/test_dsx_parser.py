@@ -0,0 +1,210 @@
+"""DSXParser 소스/타겟 테이블 추출 회귀 테스트"""
+
+import pytest
+
+from src.datastage import dsx_parser
+from src.datastage.dsx_parser import DSXParser
+
+HEADER = """BEGIN HEADER
+   CharacterSet "CP1252"
+   ServerName "ETLSRV01"
+   ToolInstanceID "BIDW_ADM"
+END HEADER
+"""
+
+
+def _xml_properties(context=None, table=None, sql=None, inline=False):
+    """
+    XMLProperties DSSUBRECORD 문자열 생성
+
+    inline이면 "XMLProperties Value" 한 줄 형식으로 만들어 XML 파싱 경로를 거치게 합니다.
+    """
+    parts = ["<?xml version='1.0' encoding='UTF-16'?><Properties version='1.1'><Common>"]
+    if context is not None:
+        parts.append(f"<Context type='int'>{context}</Context>")
+    parts.append("</Common><Usage>")
+    if table is not None:
+        parts.append(f"<TableName modified='1'><![CDATA[{table}]]></TableName>")
+    if sql is not None:
+        parts.append(f"<SQL><![CDATA[{sql}]]></SQL>")
+    parts.append("</Usage></Properties>")
+    if inline:
+        return (
+            "      BEGIN DSSUBRECORD\n"
+            "         XMLProperties Value =+=+=+=\n"
+            + "".join(parts)
+            + "\n=+=+=+=\n"
+            "      END DSSUBRECORD\n"
+        )
+    return (
+        "      BEGIN DSSUBRECORD\n"
+        '         Name "XMLProperties"\n'
+        "         Value =+=+=+=\n"
+        + "".join(parts)
+        + "\n=+=+=+=\n"
+        "      END DSSUBRECORD\n"
+    )
+
+
+def _record(identifier, name, stage_type, extra=""):
+    """Stage DSRECORD 문자열 생성"""
+    return (
+        "   BEGIN DSRECORD\n"
+        f'      Identifier "{identifier}"\n'
+        '      OLEType "CCustomStage"\n'
+        f'      Name "{name}"\n'
+        f'      StageType "{stage_type}"\n'
+        + extra
+        + "   END DSRECORD\n"
+    )
+
+
+def _job(name, records):
+    """ROOT 레코드와 Stage 레코드로 DSJOB 문자열 생성"""
+    return (
+        "BEGIN DSJOB\n"
+        f'   Identifier "{name}"\n'
+        "   BEGIN DSRECORD\n"
+        '      Identifier "ROOT"\n'
+        '      OLEType "CJobDefn"\n'
+        f'      Name "{name}"\n'
+        "   END DSRECORD\n"
+        + "".join(records)
+        + "END DSJOB\n"
+    )
+
+
+def _tables(tables):
+    return [(t["schema"], t["table_name"], t["stage_name"], t["table_type"]) for t in tables]
+
+
+@pytest.fixture
+def parser():
+    return DSXParser()
+
+
+def test_source_inferred_from_stage_name(parser):
+    """XMLProperties/TableName이 없는 Connector Stage는 S_ 접두사를 뗀 이름을 소스 테이블로 추론"""
+    content = HEADER + _job("J_STAGE_SRC", [_record("V0S1", "S_CM_USER_M", "ODBCConnectorPX")])
+    job = parser.parse_dsx_content(content)
+    assert _tables(job["source_tables"]) == [("", "CM_USER_M", "S_CM_USER_M", "source")]
+    assert job["target_tables"] == []
+
+
+def test_target_inferred_from_stage_name(parser):
+    """L_T_ 접두사 Connector Stage는 접두사를 뗀 이름을 타겟 테이블로 추론"""
+    content = HEADER + _job("J_STAGE_TGT", [_record("V0S1", "L_T_FT_SALES", "ODBCConnectorPX")])
+    job = parser.parse_dsx_content(content)
+    assert job["source_tables"] == []
+    assert _tables(job["target_tables"]) == [("", "FT_SALES", "L_T_FT_SALES", "target")]
+
+
+def test_bidw_tabledef(parser):
+    """BIDW TableDef 경로에서 스키마/테이블 추출"""
+    tabledef = '      TableDef "Database\\\\BIDWDEV\\\\BIDWADM.CD_DAY_NM"\n'
+    content = HEADER + _job("J_BIDW", [_record("V0S1", "S_FT_READ", "DB2ConnectorPX", tabledef)])
+    job = parser.parse_dsx_content(content)
+    assert _tables(job["source_tables"]) == [("BIDWADM", "CD_DAY_NM", "S_FT_READ", "source")]
+    assert job["target_tables"] == []
+
+
+def test_erp_table_with_target_context_is_also_source(parser):
+    """Context가 2여도 ERP 테이블은 소스로 간주 (타겟에도 포함)"""
+    extra = _xml_properties(context=2, table="FILA_ERP.MTL_ITEMS")
+    content = HEADER + _job("J_ERP_CTX2", [_record("V0S1", "ERP_LOOKUP", "ODBCConnectorPX", extra)])
+    job = parser.parse_dsx_content(content)
+    assert _tables(job["source_tables"]) == [("FILA_ERP", "MTL_ITEMS", "ERP_LOOKUP", "source")]
+    assert _tables(job["target_tables"]) == [("FILA_ERP", "MTL_ITEMS", "ERP_LOOKUP", "target")]
+
+
+def test_context_less_stage_name_prefix(parser):
+    """Context가 없으면 s\\d+_/l_t_ 같은 Stage 이름 접두사로 소스/타겟 판단 (판단할 수 없으면 제외)"""
+    records = [
+        _record("V0S1", "S2_ORDERS", "ODBCConnectorPX", _xml_properties(table="BIDWADM.OD_ORDERS")),
+        _record("V0S2", "L_T_ORDERS", "ODBCConnectorPX", _xml_properties(table="BIDWADM.FT_ORDERS")),
+        _record("V0S3", "LOOKUP_ORDERS", "ODBCConnectorPX", _xml_properties(table="BIDWADM.CD_ORDERS")),
+    ]
+    job = parser.parse_dsx_content(HEADER + _job("J_NO_CONTEXT", records))
+    assert _tables(job["source_tables"]) == [("BIDWADM", "OD_ORDERS", "S2_ORDERS", "source")]
+    assert _tables(job["target_tables"]) == [("BIDWADM", "FT_ORDERS", "L_T_ORDERS", "target")]
+
+
+def test_context_overrides_stage_name(parser):
+    """Context가 있으면 Stage 이름보다 Context(1 = 소스, 2 = 타겟)를 따름"""
+    records = [
+        _record("V0S1", "T_CD_CODE", "ODBCConnectorPX", _xml_properties(context=1, table="BIDWADM.CD_CODE")),
+        _record("V0S2", "S_OD_CM_USER_M", "ODBCConnectorPX", _xml_properties(context=2, table="BIDWADM.OD_CM_USER_M")),
+    ]
+    job = parser.parse_dsx_content(HEADER + _job("J_CONTEXT", records))
+    assert _tables(job["source_tables"]) == [("BIDWADM", "CD_CODE", "T_CD_CODE", "source")]
+    assert _tables(job["target_tables"]) == [("BIDWADM", "OD_CM_USER_M", "S_OD_CM_USER_M", "target")]
+
+
+def test_sql_field_table_does_not_stop_record_scan(parser):
+    """XML <SQL> 필드에서 찾은 테이블도 추가하고 이후 레코드도 계속 추출"""
+    records = [
+        _record("V0S1", "SRC_A", "ODBCConnectorPX", _xml_properties(context=1, sql="SELECT * FROM BIDWADM.CD_A", inline=True)),
+        _record("V0S2", "SRC_B", "ODBCConnectorPX", _xml_properties(context=1, table="BIDWADM.CD_B", inline=True)),
+    ]
+    content = HEADER + _job("J_SQL_FIELD", records)
+    job = parser.parse_dsx_content(content)
+    assert _tables(job["source_tables"]) == [
+        ("BIDWADM", "CD_A", "SRC_A", "source"),
+        ("BIDWADM", "CD_B", "SRC_B", "source"),
+    ]
+    multi_sources = parser.parse_multiple_jobs(content)[0]["source_tables"]
+    assert [(t["schema"], t["table_name"]) for t in multi_sources] == [("BIDWADM", "CD_A"), ("BIDWADM", "CD_B")]
+
+
+def test_scan_directory_skips_failing_file(parser, tmp_path, monkeypatch):
+    """파일 하나에서 예상하지 못한 예외가 나도 나머지 파일은 스캔"""
+    (tmp_path / "bad.dsx").write_text(HEADER + _job("J_BAD", []), encoding="utf-8")
+    (tmp_path / "good.dsx").write_text(HEADER + _job("J_GOOD", []), encoding="utf-8")
+    parse_multiple_jobs = DSXParser.parse_multiple_jobs
+
+    def failing_parse(self, content, file_path=None):
+        if file_path.endswith("bad.dsx"):
+            raise RuntimeError("malformed")
+        return parse_multiple_jobs(self, content, file_path)
+
+    monkeypatch.setattr(DSXParser, "parse_multiple_jobs", failing_parse)
+    DSXParser.clear_cache()
+    jobs = parser.scan_directory(str(tmp_path))
+    assert [job["name"] for job in jobs] == ["J_GOOD"]
+
+
+def test_undecodable_bytes_are_dropped(parser, tmp_path):
+    """UTF-8이 아닌 바이트는 다른 인코딩으로 해석하지 않고 버림"""
+    record = _record("V0S1", "S_READ", "ODBCConnectorPX", '      TableName "BIDWADM.D@pot_T"\n')
+    content = HEADER + _job("J_D@pot", [record])
+    dsx_file = tmp_path / "cp1252.dsx"
+    # CP1252 'Ä'(0xC4)는 CP949 선행 바이트 범위라 CP949로 해석하면 다음 글자와 합쳐짐
+    dsx_file.write_bytes(content.encode("ascii").replace(b"@", b"\xc4"))
+    job = parser.parse_dsx_file(str(dsx_file))
+    assert job["name"] == "J_Dpot"
+    assert _tables(job["source_tables"]) == [("BIDWADM", "Dpot_T", "S_READ", "source")]
+
+
+def test_scan_directory_limits_read_ahead(parser, tmp_path, monkeypatch):
+    """디렉토리 스캔 시 파싱 중인 파일 외에는 _SCAN_READ_AHEAD개까지만 미리 읽음"""
+    for i in range(10):
+        (tmp_path / f"job_{i}.dsx").write_text(HEADER + _job(f"J_{i}", []), encoding="utf-8")
+    load_dsx_candidate = dsx_parser._load_dsx_candidate
+    scan_dsx_file = DSXParser._scan_dsx_file
+    loaded = []
+    unparsed_counts = []
+
+    def counting_load(file_path):
+        loaded.append(file_path)
+        return load_dsx_candidate(file_path)
+
+    def counting_scan(self, dsx_file, load_content):
+        unparsed_counts.append(len(loaded) - len(unparsed_counts))
+        return scan_dsx_file(self, dsx_file, load_content)
+
+    monkeypatch.setattr(dsx_parser, "_load_dsx_candidate", counting_load)
+    monkeypatch.setattr(DSXParser, "_scan_dsx_file", counting_scan)
+    DSXParser.clear_cache()
+    jobs = parser.scan_directory(str(tmp_path))
+    assert sorted(job["name"] for job in jobs) == [f"J_{i}" for i in range(10)]
+    assert max(unparsed_counts) <= dsx_parser._SCAN_READ_AHEAD + 1
@@ -0,0 +1,123 @@
+"""ERPImpactAnalyzer 1차/2차 연관 Job 탐색 테스트"""
+
+import pytest
+
+from src.datastage import erp_impact_analyzer
+from src.datastage.erp_impact_analyzer import ERPImpactAnalyzer
+
+IMPACT_CONFIG = {
+    "erp_impact": {
+        "od_schemas": ["BIDWADM_CO"],
+        "od_prefixes": ["OD_"],
+        "ft_schemas": ["BIDWADM", "BIDWREP"],
+        "ft_prefixes": ["FT_"],
+    }
+}
+
+
+def _table(full_name):
+    schema, table_name = full_name.split(".", 1)
+    return {"schema": schema, "table_name": table_name}
+
+
+def _job(job_name, file_path, sources, targets):
+    """DependencyAnalyzer Job 의존성 정보 형태의 메타데이터"""
+    return {
+        "job_name": job_name,
+        "file_path": file_path,
+        "tables": [],
+        "columns": {},
+        "source_tables": [_table(t) for t in sources],
+        "target_tables": [_table(t) for t in targets],
+    }
+
+
+class FakeDependencyAnalyzer:
+    """파일별 Job 목록을 그대로 돌려주는 DependencyAnalyzer 대역"""
+
+    def __init__(self, export_directory, files, column_files):
+        self.export_directory = export_directory
+        self.files = files
+        self.column_files = column_files
+
+    def find_jobs_using_column_only(self, column_name, export_directory=None):
+        return [
+            {"job_name": job["job_name"], "file_path": file_path, "all_tables": []}
+            for file_path in self.column_files
+            for job in self.files[file_path]
+        ]
+
+    def analyze_file_dependencies(self, dsx_file_path):
+        return list(self.files.get(dsx_file_path, []))
+
+    def analyze_all_dependencies(self, export_directory=None):
+        return {"jobs": [job for jobs in self.files.values() for job in jobs]}
+
+
+@pytest.fixture(autouse=True)
+def impact_config(monkeypatch):
+    monkeypatch.setattr(erp_impact_analyzer, "get_config", lambda: IMPACT_CONFIG)
+
+
+def _analyzer(tmp_path, files, column_files):
+    dependency_analyzer = FakeDependencyAnalyzer(tmp_path, files, column_files)
+    return ERPImpactAnalyzer(dependency_analyzer, export_directory=str(tmp_path), erp_tables={"FILA_ERP.MTL_ITEMS"})
+
+
+def test_same_job_name_in_tier1_and_tier2_files(tmp_path):
+    """같은 이름의 Job이 다른 파일에서 1차/2차 연관이면 각 파일의 테이블로 판단"""
+    files = {
+        "A.dsx": [_job("J_DUP", "A.dsx", ["FILA_ERP.MTL_ITEMS"], ["BIDWADM_CO.OD_ITEMS"])],
+        "B.dsx": [_job("J_DUP", "B.dsx", ["BIDWADM_CO.OD_ITEMS"], ["BIDWADM.FT_ITEMS"])],
+    }
+    result = _analyzer(tmp_path, files, ["A.dsx"]).analyze_column("ITEM_ID")
+
+    assert [(j["job_name"], j["file_path"]) for j in result["tier1_jobs"]] == [("J_DUP", "A.dsx")]
+    assert [(j["job_name"], j["file_path"], j["ft_targets"]) for j in result["tier2_jobs"]] == [
+        ("J_DUP", "B.dsx", ["BIDWADM.FT_ITEMS"]),
+    ]
+
+
+def test_same_job_name_in_two_tier1_files(tmp_path):
+    """컬럼을 사용하는 같은 이름의 Job이 두 파일에 있으면 각 파일의 메타데이터로 1차 연관 판단"""
+    files = {
+        "A.dsx": [_job("J_DUP", "A.dsx", ["FILA_ERP.MTL_ITEMS"], ["BIDWADM_CO.OD_ITEMS_A"])],
+        "B.dsx": [_job("J_DUP", "B.dsx", ["FILA_ERP.MTL_ITEMS"], ["BIDWADM_CO.OD_ITEMS_B"])],
+    }
+    result = _analyzer(tmp_path, files, ["A.dsx", "B.dsx"]).analyze_column("ITEM_ID", max_level=1)
+
+    assert [(j["job_name"], j["file_path"], j["od_targets"]) for j in result["tier1_jobs"]] == [
+        ("J_DUP", "A.dsx", ["BIDWADM_CO.OD_ITEMS_A"]),
+        ("J_DUP", "B.dsx", ["BIDWADM_CO.OD_ITEMS_B"]),
+    ]
+
+
+class CountingDependencyAnalyzer(FakeDependencyAnalyzer):
+    """분석 호출을 기록하는 DependencyAnalyzer 대역"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.calls = []
+
+    def analyze_file_dependencies(self, dsx_file_path):
+        self.calls.append(("file", dsx_file_path))
+        return super().analyze_file_dependencies(dsx_file_path)
+
+    def analyze_all_dependencies(self, export_directory=None):
+        self.calls.append(("all",))
+        return super().analyze_all_dependencies(export_directory)
+
+
+@pytest.mark.parametrize("max_level, expected_calls", [(2, [("all",)]), (1, [("file", "A.dsx")])])
+def test_each_file_is_analyzed_once(tmp_path, max_level, expected_calls):
+    """2차 연관까지 분석하면 전체 분석 한 번만, 1차만 분석하면 컬럼을 사용하는 파일만 분석"""
+    files = {
+        "A.dsx": [_job("J_ERP", "A.dsx", ["FILA_ERP.MTL_ITEMS"], ["BIDWADM_CO.OD_ITEMS"])],
+        "B.dsx": [_job("J_OD", "B.dsx", ["BIDWADM_CO.OD_ITEMS"], ["BIDWADM.FT_ITEMS"])],
+    }
+    dependency_analyzer = CountingDependencyAnalyzer(tmp_path, files, ["A.dsx"])
+    analyzer = ERPImpactAnalyzer(dependency_analyzer, export_directory=str(tmp_path), erp_tables={"FILA_ERP.MTL_ITEMS"})
+    result = analyzer.analyze_column("ITEM_ID", max_level=max_level)
+
+    assert [j["job_name"] for j in result["tier1_jobs"]] == ["J_ERP"]
+    assert dependency_analyzer.calls == expected_calls